@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import shutil
@@ -184,17 +185,32 @@ def _generate_update_manifest(config: BuildConfig) -> None:
     manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
 
 
+def _build_icon_bytes(size: int = 256) -> bytes:
+    """Render the placeholder icon as ICO bytes without touching disk."""
+
+    image = Image.new("RGBA", (size, size), (30, 30, 68, 255))
+    buffer = io.BytesIO()
+    image.save(buffer, format="ICO")
+    return buffer.getvalue()
+
+
+def _write_icon(icon_path: Path, data: bytes) -> None:
+    icon_path.parent.mkdir(parents=True, exist_ok=True)
+    icon_path.write_bytes(data)
+
+
 def _ensure_icon(icon_path: Path) -> None:
     if icon_path.exists():
         return
+    if icon_path.suffix.lower() == ".ico":
+        _write_icon(icon_path, _build_icon_bytes())
+        return
     icon_path.parent.mkdir(parents=True, exist_ok=True)
     size = 256
     image = Image.new("RGBA", (size, size), (30, 30, 68, 255))
     temp_png = icon_path.with_suffix(".png")
     image.save(temp_png)
-    if icon_path.suffix.lower() == ".ico":
-        image.save(icon_path, format="ICO")
-    elif icon_path.suffix.lower() == ".icns":
+    if icon_path.suffix.lower() == ".icns":
         if sys.platform == "darwin" and shutil.which("iconutil"):
             iconset = icon_path.parent / "temp.iconset"
             iconset.mkdir(exist_ok=True)
@@ -33,6 +33,10 @@ from qiskit.primitives import Sampler as ReferenceSampler
 from utils.logger import log_quantum_job
 
 
+class NonRetryableError(RuntimeError):
+    """Raised by executors to abort ``execute_with_retries`` immediately."""
+
+
 class BackendManager:
     """Manage IBM Quantum backends with robust fallbacks.
 
@@ -256,6 +260,8 @@ class BackendManager:
             try:
                 logger.info("Attempt {} for {}", attempt, description)
                 return executor()
+            except NonRetryableError:
+                raise
             except Exception as exc:  # pragma: no cover - runtime specific
                 last_exception = exc
                 logger.error("Execution attempt {} failed for {}: {}", attempt, description, exc)
@@ -265,5 +271,5 @@ class BackendManager:
         raise RuntimeError(f"All retries failed for {description}") from last_exception
 
 
-__all__ = ["BackendManager"]
+__all__ = ["BackendManager", "NonRetryableError"]
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
 
 import numpy as np
 from loguru import logger
@@ -14,11 +14,15 @@ from qiskit_algorithms.optimizers import COBYLA
 from qiskit.quantum_info import SparsePauliOp
 from qiskit.result import QuasiDistribution
 
-from .backend_manager import BackendManager
+from .backend_manager import BackendManager, NonRetryableError
 from .portfolio_qubo import PortfolioQUBO
 from utils.logger import log_performance_metric
 
 
+class OptimizationCancelledError(NonRetryableError):
+    """Raised when a ``cancel_check`` hook aborts an in-flight optimization."""
+
+
 @dataclass(slots=True)
 class OptimizationResult:
     """Container for QAOA optimization outcomes."""
@@ -61,6 +65,7 @@ class QuantumPortfolioOptimizer:
         budget: float = 1.0,
         sector_limits: dict[str, dict[str, Iterable[int] | int]] | None = None,
         shots: int = 2048,
+        cancel_check: Callable[[], bool] | None = None,
     ) -> OptimizationResult:
         """Find optimal portfolio weights using QAOA.
 
@@ -76,6 +81,9 @@ class QuantumPortfolioOptimizer:
             Optional diversification constraints by sector.
         shots:
             Number of measurement shots for the quantum primitive.
+        cancel_check:
+            Optional hook polled between QAOA iterations; returning True
+            aborts the run with :class:`OptimizationCancelledError`.
         """
 
         start_time = time.perf_counter()
@@ -109,12 +117,21 @@ class QuantumPortfolioOptimizer:
 
         optimizer = COBYLA(maxiter=self.optimizer_maxiter, tol=1e-3)
 
+        qaoa_callback = None
+        if cancel_check is not None:
+
+            def qaoa_callback(_eval_count, _params, _mean, _std):  # noqa: ANN001
+                if cancel_check():
+                    msg = "Optimization cancelled"
+                    raise OptimizationCancelledError(msg)
+
         with self.backend_manager.get_sampler(num_qubits=num_assets, shots=shots) as sampler:
             qaoa = QAOA(
                 sampler=sampler,
                 optimizer=optimizer,
                 reps=self.num_layers,
                 initial_point=initial_point,
+                callback=qaoa_callback,
             )
 
             result = self.backend_manager.execute_with_retries(
@@ -270,5 +287,5 @@ class QuantumPortfolioOptimizer:
         return h, j_matrix, offset
 
 
-__all__ = ["QuantumPortfolioOptimizer", "OptimizationResult"]
+__all__ = ["QuantumPortfolioOptimizer", "OptimizationResult", "OptimizationCancelledError"]
 
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import os
-from datetime import datetime
+import time
+from functools import cached_property
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence
 
+import numpy as np
+import pandas as pd
 from loguru import logger
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QSettings, QTimer, Signal
 
 from trading.alpaca_client import AlpacaClient, Position
 from trading.performance_tracker import PerformanceTracker
@@ -15,10 +19,10 @@ from trading.execution_engine import ExecutionEngine, Order
 from trading.portfolio_manager import LivePortfolioManager, RebalancePlan
 from ..utils.signal_manager import SignalManager
 
-try:  # Optional dependency for price retrieval on new symbols
-    import yfinance as yf
-except ImportError:  # pragma: no cover - optional path
-    yf = None
+# Bound format methods reused across the row-building hotpaths; binding
+# once avoids re-parsing the spec for every cell.
+_QTY_FMT = "{:.4f}".format
+_PRICE_FMT = "{:.2f}".format
 
 
 class TradingController(QObject):
@@ -29,6 +33,7 @@ class TradingController(QObject):
     performance_updated = Signal(dict)
     positions_updated = Signal(list)
     orders_updated = Signal(list)
+    orders_delta_updated = Signal(list)  # new fills since the last refresh
     status_message = Signal(str, str)  # level, message
     target_updated = Signal(list)  # list of symbols represented in target
 
@@ -40,21 +45,56 @@ class TradingController(QObject):
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
-        self._client = client or AlpacaClient()
-        self._performance = performance_tracker or PerformanceTracker()
+        # Injected collaborators shadow the cached properties below; the
+        # defaults are built lazily on first use so an unopened trading tab
+        # never pays for Alpaca client construction.
+        if client is not None:
+            self._client = client
+        if performance_tracker is not None:
+            self._performance = performance_tracker
         self._connected = False
-        self._execution = ExecutionEngine()
-        self._manager = LivePortfolioManager(
-            trading_client=self._client,
-            execution_engine=self._execution,
-            performance_tracker=self._performance,
-        )
+        # Coalesce bursts of refresh triggers into a single REST round-trip.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         self._signal_manager = SignalManager.instance()
         self._signal_manager.portfolio_updated.connect(self._handle_portfolio_update)
         self._signal_manager.quantum_job_completed.connect(self._handle_quantum_result)
+        self._settings = QSettings("Quantum Trading Labs", "Quantum Portfolio Optimizer")
         self._latest_symbols: list[str] = []
-        self._latest_target_weights: Dict[str, float] = {}
+        self._latest_target_weights: Dict[str, float] = self._restore_target_weights()
+        if self._latest_target_weights:
+            self._latest_symbols = list(self._latest_target_weights.keys())
         self._last_plan: Optional[RebalancePlan] = None
+        # Number of order rows already pushed to the UI; refreshes emit
+        # only the fills past this watermark.
+        self._orders_emitted = 0
+        self._last_payload_hash: Optional[int] = None
+        self._last_weights_hash: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    # Lazily-built collaborators
+    # ------------------------------------------------------------------
+    @cached_property
+    def _client(self) -> AlpacaClient:
+        return AlpacaClient()
+
+    @cached_property
+    def _performance(self) -> PerformanceTracker:
+        return PerformanceTracker()
+
+    @cached_property
+    def _execution(self) -> ExecutionEngine:
+        return ExecutionEngine()
+
+    @cached_property
+    def _manager(self) -> LivePortfolioManager:
+        return LivePortfolioManager(
+            trading_client=self._client,
+            execution_engine=self._execution,
+            performance_tracker=self._performance,
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -92,10 +132,13 @@ class TradingController(QObject):
             self.connection_changed.emit(False, str(exc))
 
     def refresh_data(self, checked: bool | None = False) -> None:  # noqa: ARG002 - Qt passes state
-        """Pull latest account, position, and performance data."""
+        """Schedule a debounced pull of account, position, and performance data."""
 
         del checked
 
+        self._refresh_timer.start()
+
+    def _do_refresh(self) -> None:
         if not self._connected:
             self.connection_changed.emit(False, "Not connected")
             return
@@ -113,8 +156,19 @@ class TradingController(QObject):
             positions = self._client.get_positions()
             self.positions_updated.emit(self._transform_positions(positions))
 
-            self.orders_updated.emit(self._transform_orders())
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            # Order history is append-only between refreshes, so emit only
+            # the delta past the watermark; a full snapshot goes out on the
+            # first refresh or after a preview replaced the table contents.
+            order_count = len(self._performance.orders)
+            if self._orders_emitted and order_count >= self._orders_emitted:
+                if order_count > self._orders_emitted:
+                    self.orders_delta_updated.emit(
+                        self._transform_orders(start=self._orders_emitted)
+                    )
+            else:
+                self.orders_updated.emit(self._transform_orders())
+            self._orders_emitted = order_count
+            timestamp = time.strftime("%H:%M:%S")
             self.connection_changed.emit(True, f"Last refreshed at {timestamp}")
             self.status_message.emit("info", "Account data refreshed")
         except Exception as exc:  # noqa: BLE001
@@ -138,9 +192,17 @@ class TradingController(QObject):
         self._last_plan = plan
         preview_rows = self._orders_to_rows(orders, plan, status_suffix="(preview)")
         self.orders_updated.emit(preview_rows)
-        total_notional = sum(
-            order.qty * plan.latest_prices.get(order.symbol, 0.0) for order in orders
+        # The preview replaced the table contents; force the next refresh
+        # to resend the real history as a snapshot.
+        self._orders_emitted = 0
+        get_price = plan.latest_prices.get
+        qtys = np.fromiter((order.qty for order in orders), dtype=np.float64, count=len(orders))
+        prices = np.fromiter(
+            (get_price(order.symbol, 0.0) for order in orders),
+            dtype=np.float64,
+            count=len(orders),
         )
+        total_notional = float(qtys @ prices)
         self.status_message.emit(
             "info",
             f"Preview ready: {len(orders)} orders totalling ${total_notional:,.2f}",
@@ -167,31 +229,34 @@ class TradingController(QObject):
     # Helpers
     # ------------------------------------------------------------------
     def _transform_positions(self, positions: List[Position]) -> list[dict[str, object]]:
-        rows: list[dict[str, object]] = []
-        for position in positions:
-            rows.append(
-                {
-                    "Symbol": position.symbol,
-                    "Qty": f"{position.qty:.4f}",
-                    "Avg Price": f"{position.avg_entry_price:.2f}",
-                    "P&L": f"{position.unrealized_pl:.2f}",
-                }
-            )
-        return rows
-
-    def _transform_orders(self) -> list[dict[str, object]]:
-        rows: list[dict[str, object]] = []
-        for order in self._performance.orders:
-            rows.append(
-                {
-                    "Order ID": order.order_id,
-                    "Symbol": order.symbol,
-                    "Qty": f"{order.qty:.4f}",
-                    "Price": f"{order.filled_price:.2f}",
-                    "Status": order.status,
-                }
-            )
-        return rows
+        if not positions:
+            return []
+        frame = pd.DataFrame(
+            [
+                (pos.symbol, pos.qty, pos.avg_entry_price, pos.unrealized_pl)
+                for pos in positions
+            ],
+            columns=["Symbol", "Qty", "Avg Price", "P&L"],
+        )
+        frame["Qty"] = frame["Qty"].map(_QTY_FMT)
+        frame["Avg Price"] = frame["Avg Price"].map(_PRICE_FMT)
+        frame["P&L"] = frame["P&L"].map(_PRICE_FMT)
+        return frame.to_dict("records")
+
+    def _transform_orders(self, start: int = 0) -> list[dict[str, object]]:
+        orders = self._performance.orders[start:]
+        if not orders:
+            return []
+        frame = pd.DataFrame(
+            [
+                (order.order_id, order.symbol, order.qty, order.filled_price, order.status)
+                for order in orders
+            ],
+            columns=["Order ID", "Symbol", "Qty", "Price", "Status"],
+        )
+        frame["Qty"] = frame["Qty"].map(_QTY_FMT)
+        frame["Price"] = frame["Price"].map(_PRICE_FMT)
+        return frame.to_dict("records")
 
     # ------------------------------------------------------------------
     # Target handling
@@ -201,27 +266,53 @@ class TradingController(QObject):
         if not isinstance(assets, list) or not assets:
             return
 
-        symbols: list[str] = []
+        try:  # Skip downstream slot work when the payload is unchanged
+            payload_hash = hash(
+                tuple(
+                    (str(entry.get("symbol", "")).upper(), str(entry.get("allocation", "")))
+                    for entry in assets
+                    if isinstance(entry, Mapping)
+                )
+            )
+        except TypeError:
+            payload_hash = None
+        if payload_hash is not None and payload_hash == self._last_payload_hash:
+            return
+
+        # Insertion-ordered dict doubles as the symbol list; clamping of
+        # negative allocations happens once in _normalize_weights.
         raw_weights: Dict[str, float] = {}
-        for entry in assets:
-            if not isinstance(entry, Mapping):
-                continue
-            symbol = str(entry.get("symbol", "")).upper()
-            if not symbol:
-                continue
-            try:
-                allocation = float(entry.get("allocation", 0.0)) / 100.0
-            except (TypeError, ValueError):
-                allocation = 0.0
-            symbols.append(symbol)
-            raw_weights[symbol] = max(allocation, 0.0)
+        symbols_col = payload.get("symbols")
+        allocations_col = payload.get("allocations")
+        if isinstance(symbols_col, Sequence) and allocations_col is not None:
+            # Columnar payload from PortfolioWidget: the allocations arrive
+            # as a float64 array, so no per-entry parsing is needed.
+            for symbol, allocation in zip(symbols_col, allocations_col):
+                symbol = str(symbol).upper()
+                if symbol:
+                    raw_weights[symbol] = float(allocation) / 100.0
+        else:
+            for entry in assets:
+                if not isinstance(entry, Mapping):
+                    continue
+                symbol = str(entry.get("symbol", "")).upper()
+                if not symbol:
+                    continue
+                try:
+                    allocation = float(entry.get("allocation", 0.0)) / 100.0
+                except (TypeError, ValueError):
+                    allocation = 0.0
+                raw_weights[symbol] = allocation
 
         normalized = self._normalize_weights(raw_weights)
         if not normalized:
             return
 
+        symbols = list(raw_weights.keys())
         self._latest_symbols = symbols
         self._latest_target_weights = normalized
+        self._last_payload_hash = payload_hash
+        self._persist_target_weights(normalized)
         self.target_updated.emit(symbols)
         self.status_message.emit(
             "info", f"Loaded portfolio allocations for {len(symbols)} assets"
@@ -229,7 +320,13 @@ class TradingController(QObject):
 
     def _handle_quantum_result(self, payload: Mapping[str, object]) -> None:
         weights = payload.get("weights")
-        if not isinstance(weights, Sequence):
+        if not isinstance(weights, (Sequence, np.ndarray)):
+            return
+        try:
+            weights_hash = hash(tuple(weights))
+        except TypeError:
+            weights_hash = None
+        if weights_hash is not None and weights_hash == self._last_weights_hash:
             return
         if not self._latest_symbols:
             self.status_message.emit(
@@ -254,6 +351,8 @@ class TradingController(QObject):
             return
 
         self._latest_target_weights = normalized
+        self._last_weights_hash = weights_hash
+        self._persist_target_weights(normalized)
         self.target_updated.emit(list(normalized.keys()))
         self.status_message.emit(
             "success", "Applied latest quantum optimization weights to trading target"
@@ -280,27 +379,32 @@ class TradingController(QObject):
     def _build_price_map(
         self, symbols: Iterable[str], positions: Sequence[Position]
     ) -> Dict[str, float]:
+        wanted = frozenset(symbols)
         price_map: Dict[str, float] = {
             pos.symbol: float(pos.current_price)
             for pos in positions
-            if pos.current_price and pos.current_price > 0
+            if pos.symbol in wanted and pos.current_price and pos.current_price > 0
         }
-        missing = [symbol for symbol in symbols if price_map.get(symbol, 0.0) <= 0]
-        if missing and yf is not None:
-            fetched = self._fetch_prices(missing)
-            price_map.update(fetched)
-            missing = [symbol for symbol in symbols if price_map.get(symbol, 0.0) <= 0]
+        missing = [symbol for symbol in wanted if price_map.get(symbol, 0.0) <= 0]
+        if missing:
+            price_map.update(self._fetch_prices(missing))
+            missing = [symbol for symbol in missing if price_map.get(symbol, 0.0) <= 0]
         if missing:
             raise ValueError(
-                "Missing market prices for: " + ", ".join(sorted(set(missing)))
+                "Missing market prices for: " + ", ".join(sorted(missing))
             )
         return price_map
 
     def _fetch_prices(self, symbols: Sequence[str]) -> Dict[str, float]:
-        if yf is None:  # pragma: no cover - optional dependency handling
-            raise RuntimeError(
-                "yfinance is required to fetch market prices for new symbols"
-            )
+        yf = getattr(self, "_yf", None)
+        if yf is None:
+            try:  # Imported on first use; pulls in pandas/lxml only when needed
+                import yfinance as yf
+            except ImportError as exc:  # pragma: no cover - optional path
+                raise RuntimeError(
+                    "yfinance is required to fetch market prices for new symbols"
+                ) from exc
+            self._yf = yf
         prices: Dict[str, float] = {}
         for symbol in symbols:
             try:
@@ -312,6 +416,22 @@ class TradingController(QObject):
                 logger.warning("Failed to fetch price for {}: {}", symbol, exc)
         return prices
 
+    def _persist_target_weights(self, weights: Mapping[str, float]) -> None:
+        """Store the accepted target so warm restarts can rebalance directly."""
+
+        self._settings.setValue("target/weights", json.dumps(dict(weights)))
+
+    def _restore_target_weights(self) -> Dict[str, float]:
+        raw = self._settings.value("target/weights", "{}")
+        try:
+            weights = json.loads(str(raw))
+            if not isinstance(weights, dict):
+                return {}
+            parsed = {str(symbol): float(value) for symbol, value in weights.items()}
+        except (TypeError, ValueError):
+            return {}
+        return self._normalize_weights(parsed)
+
     def _normalize_weights(self, weights: Mapping[str, float]) -> Dict[str, float]:
         positive = {symbol: max(0.0, float(weight)) for symbol, weight in weights.items()}
         total = sum(positive.values())
@@ -326,21 +446,18 @@ class TradingController(QObject):
         *,
         status_suffix: str = "",
     ) -> list[dict[str, object]]:
-        rows: list[dict[str, object]] = []
-        for order in orders:
-            status = order.side.upper()
-            if status_suffix:
-                status = f"{status} {status_suffix}".strip()
-            rows.append(
-                {
-                    "Order ID": "-",
-                    "Symbol": order.symbol,
-                    "Qty": f"{order.qty:.4f}",
-                    "Price": f"{plan.latest_prices.get(order.symbol, 0.0):.2f}",
-                    "Status": status,
-                }
-            )
-        return rows
+        suffix = f" {status_suffix}" if status_suffix else ""
+        get_price = plan.latest_prices.get
+        return [
+            {
+                "Order ID": "-",
+                "Symbol": order.symbol,
+                "Qty": _QTY_FMT(order.qty),
+                "Price": _PRICE_FMT(get_price(order.symbol, 0.0)),
+                "Status": order.side.upper() + suffix,
+            }
+            for order in orders
+        ]
 
 
 __all__ = ["TradingController"]
@@ -4,23 +4,33 @@ from __future__ import annotations
 
 from PySide6.QtCore import QSettings
 from PySide6.QtWidgets import (
+    QCheckBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
     QLineEdit,
-    QMessageBox,
     QSpinBox,
     QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
-from ..utils.validators import NumericRangeValidator
-
 
 class SettingsDialog(QDialog):
     """Configuration interface for quantum, market, and display settings."""
 
+    _DEFAULTS = {
+        "quantum/token": "",
+        "quantum/instance": "",
+        "quantum/backend": "",
+        "market/alpha_vantage": "",
+        "market/yahoo_enabled": "true",
+        "display/theme": "light",
+        "display/update_interval": 5,
+        "performance/cache_size": 128,
+        "performance/timeout": 60,
+    }
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Settings")
@@ -63,12 +73,10 @@ class SettingsDialog(QDialog):
         form = QFormLayout(widget)
 
         self.alpha_vantage_input = QLineEdit()
-        self.yahoo_enabled_input = QLineEdit()
-
-        self.yahoo_enabled_input.setPlaceholderText("true/false")
+        self.yahoo_enabled_input = QCheckBox("Enabled")
 
         form.addRow("Alpha Vantage API Key", self.alpha_vantage_input)
-        form.addRow("Yahoo Finance Enabled", self.yahoo_enabled_input)
+        form.addRow("Yahoo Finance", self.yahoo_enabled_input)
         return widget
 
     def _build_display_page(self) -> QWidget:
@@ -88,52 +96,59 @@ class SettingsDialog(QDialog):
         widget = QWidget(self)
         form = QFormLayout(widget)
 
-        self.cache_size_input = QLineEdit()
-        self.timeout_input = QLineEdit()
+        self.cache_size_input = QSpinBox()
+        self.timeout_input = QSpinBox()
 
-        self.cache_size_input.setValidator(NumericRangeValidator(10, 10_000, 0))
-        self.timeout_input.setValidator(NumericRangeValidator(5, 600, 0))
+        self.cache_size_input.setRange(10, 10_000)
+        self.timeout_input.setRange(5, 600)
 
         form.addRow("Cache Size (MB)", self.cache_size_input)
         form.addRow("Timeout (s)", self.timeout_input)
         return widget
 
     def _load_settings(self) -> None:
-        self.ibm_token_input.setText(self._settings.value("quantum/token", ""))
-        self.ibm_instance_input.setText(self._settings.value("quantum/instance", ""))
-        self.backend_preference_input.setText(self._settings.value("quantum/backend", ""))
-
-        self.alpha_vantage_input.setText(self._settings.value("market/alpha_vantage", ""))
-        self.yahoo_enabled_input.setText(self._settings.value("market/yahoo_enabled", "true"))
-
-        self.theme_input.setText(self._settings.value("display/theme", "light"))
-        self.update_interval_spin.setValue(int(self._settings.value("display/update_interval", 5)))
+        # Snapshot every key once so persisting can diff against it and
+        # only write back what actually changed.
+        self._snapshot = {
+            key: self._settings.value(key, default)
+            for key, default in self._DEFAULTS.items()
+        }
+        snapshot = self._snapshot
 
-        self.cache_size_input.setText(str(self._settings.value("performance/cache_size", "128")))
-        self.timeout_input.setText(str(self._settings.value("performance/timeout", "60")))
+        self.ibm_token_input.setText(snapshot["quantum/token"])
+        self.ibm_instance_input.setText(snapshot["quantum/instance"])
+        self.backend_preference_input.setText(snapshot["quantum/backend"])
 
-    def _persist_settings(self) -> None:
-        if self.yahoo_enabled_input.text().lower() not in {"true", "false"}:
-            QMessageBox.warning(self, "Validation Error", "Yahoo Finance enabled must be true or false")
-            return
-
-        if not self.cache_size_input.hasAcceptableInput() or not self.timeout_input.hasAcceptableInput():
-            QMessageBox.warning(self, "Validation Error", "Performance settings are invalid")
-            return
-
-        self._settings.setValue("quantum/token", self.ibm_token_input.text())
-        self._settings.setValue("quantum/instance", self.ibm_instance_input.text())
-        self._settings.setValue("quantum/backend", self.backend_preference_input.text())
+        self.alpha_vantage_input.setText(snapshot["market/alpha_vantage"])
+        self.yahoo_enabled_input.setChecked(
+            str(snapshot["market/yahoo_enabled"]).lower() == "true"
+        )
 
-        self._settings.setValue("market/alpha_vantage", self.alpha_vantage_input.text())
-        self._settings.setValue("market/yahoo_enabled", self.yahoo_enabled_input.text())
+        self.theme_input.setText(snapshot["display/theme"])
+        self.update_interval_spin.setValue(int(snapshot["display/update_interval"]))
 
-        self._settings.setValue("display/theme", self.theme_input.text())
-        self._settings.setValue("display/update_interval", self.update_interval_spin.value())
-
-        self._settings.setValue("performance/cache_size", self.cache_size_input.text())
-        self._settings.setValue("performance/timeout", self.timeout_input.text())
+        self.cache_size_input.setValue(int(snapshot["performance/cache_size"]))
+        self.timeout_input.setValue(int(snapshot["performance/timeout"]))
 
+    def _persist_settings(self) -> None:
+        new_snapshot = {
+            "quantum/token": self.ibm_token_input.text(),
+            "quantum/instance": self.ibm_instance_input.text(),
+            "quantum/backend": self.backend_preference_input.text(),
+            "market/alpha_vantage": self.alpha_vantage_input.text(),
+            "market/yahoo_enabled": "true" if self.yahoo_enabled_input.isChecked() else "false",
+            "display/theme": self.theme_input.text(),
+            "display/update_interval": self.update_interval_spin.value(),
+            "performance/cache_size": self.cache_size_input.value(),
+            "performance/timeout": self.timeout_input.value(),
+        }
+
+        for key, value in new_snapshot.items():
+            if str(value) != str(self._snapshot.get(key)):
+                self._settings.setValue(key, value)
+
+        self._settings.sync()
+        self._snapshot = new_snapshot
         self.accept()
 
 
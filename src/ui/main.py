@@ -7,12 +7,11 @@ import sys
 import traceback
 
 from loguru import logger
-from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 
-from quantum_engine.backend_manager import BackendManager
 from utils.logger import setup_logging
 
-from .main_window import MainWindow
 from .styles import Theme
 
 
@@ -46,20 +45,58 @@ def main(argv: list[str] | None = None) -> int:
     else:
         Theme.apply_light_theme(app)
 
-    backend_manager = BackendManager()
-    window = MainWindow(backend_manager)
-    window.apply_theme(args.theme)
-    window.show()
+    # Paint a lightweight splash before the heavy managers and the main
+    # window are constructed, then finish building on the event loop so
+    # time-to-first-paint stays low.
+    splash = QSplashScreen()
+    splash.showMessage("Loading Quantum Portfolio Optimizer…")
+    splash.show()
+    app.processEvents()
+
+    window: MainWindow | None = None
+
+    def build_main_window() -> None:
+        nonlocal window
+        # Runs inside the event loop, outside the try around app.exec();
+        # failures must surface the fatal dialog here or the user would be
+        # stuck on the splash screen forever.
+        try:
+            from quantum_engine.backend_manager import BackendManager
+
+            from .main_window import MainWindow
+
+            backend_manager = BackendManager()
+            window = MainWindow(backend_manager)
+            window.apply_theme(args.theme)
+            window.show()
+            splash.finish(window)
+        except Exception as exc:  # pragma: no cover - runtime safety net
+            logger.exception("Failed to build main window: {}", exc)
+            splash.hide()
+            dialog = QMessageBox(
+                QMessageBox.Icon.Critical,
+                "Application Error",
+                f"An unexpected error occurred:\n{exc}",
+            )
+            dialog.setDetailedText(traceback.format_exc())
+            dialog.exec()
+            app.exit(1)
+
+    QTimer.singleShot(0, build_main_window)
 
     try:
         return app.exec()
     except Exception as exc:  # pragma: no cover - runtime safety net
         logger.exception("Unhandled exception in UI: {}", exc)
-        QMessageBox.critical(
-            window,
+        dialog = QMessageBox(
+            QMessageBox.Icon.Critical,
             "Application Error",
-            f"An unexpected error occurred:\n{exc}\n\n" f"{traceback.format_exc()}",
+            f"An unexpected error occurred:\n{exc}",
+            parent=window,
         )
+        # The traceback is only rendered if the user expands the details.
+        dialog.setDetailedText(traceback.format_exc())
+        dialog.exec()
         return 1
 
 
@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
-from PySide6.QtCore import QSettings, Qt, QTimer
+from PySide6.QtCore import (
+    QByteArray,
+    QObject,
+    QRunnable,
+    QSettings,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QAction, QCloseEvent, QIcon
 from PySide6.QtWidgets import (
     QApplication,
@@ -24,7 +34,49 @@ from quantum_engine.backend_manager import BackendManager
 from .controllers import TradingController
 from .styles import Theme
 from .utils import UpdateChecker
-from .widgets import AnalyticsWidget, PortfolioWidget, QuantumWidget, ResultsWidget, TradingWidget
+# Only the eagerly-built Portfolio tab is imported at module load; the
+# other widgets (and their pandas/matplotlib dependencies) resolve inside
+# the lazy tab factories so most sessions never pay for them.
+from .widgets import PortfolioWidget
+
+if TYPE_CHECKING:
+    from .widgets import AnalyticsWidget, QuantumWidget, ResultsWidget, TradingWidget
+
+
+class _BackendProbeSignals(QObject):
+    done = Signal(str)
+
+
+class _BackendProbe(QRunnable):
+    """Resolve the active quantum backend name off the UI thread."""
+
+    def __init__(self, backend_manager: BackendManager) -> None:
+        super().__init__()
+        self.signals = _BackendProbeSignals()
+        self._backend_manager = backend_manager
+
+    def run(self) -> None:
+        try:
+            service = self._backend_manager._authenticate()  # type: ignore[attr-defined]
+            if service is None:
+                status = "Backend: Aer Simulator"
+            else:
+                backend_name = self._backend_manager._select_backend(
+                    service, num_qubits=5, prefer_hardware=False
+                )
+                status = f"Backend: {backend_name}"
+        except Exception as exc:  # noqa: BLE001 - surface as status text
+            logger.error("Failed to refresh backend status: {}", exc)
+            status = "Backend: Unavailable"
+        self.signals.done.emit(status)
+
+
+class _LazyTab(QWidget):
+    """Placeholder page whose real widget is built on first activation."""
+
+    def __init__(self, factory, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.factory = factory
 
 
 class MainWindow(QMainWindow):
@@ -37,8 +89,28 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.backend_manager = backend_manager or BackendManager()
         self.settings = QSettings(self.ORGANIZATION, self.APPLICATION)
+        self._app = QApplication.instance()
+        # In-process cache so theme toggles and state restores never hit the
+        # QSettings backing store; flushed once in closeEvent. Typed value()
+        # lookups skip the QVariant dynamic-type dispatch.
+        self._settings_cache = {
+            "ui/geometry": self.settings.value("ui/geometry", QByteArray(), type=QByteArray),
+            "ui/window_state": self.settings.value(
+                "ui/window_state", QByteArray(), type=QByteArray
+            ),
+            "ui/theme": self.settings.value("ui/theme", "light", type=str),
+        }
+        self._settings_cache_orig = dict(self._settings_cache)
         self._status_label = QLabel("Backend: Unknown")
         self._theme = "light"
+        self._theme_applied = False
+        self._icons_attached = False
+        # Coalesce bursts of status messages into one showMessage per frame.
+        self._pending_status: tuple[str, int] | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
 
         self._configure_window()
         self._create_actions()
@@ -48,17 +120,19 @@ class MainWindow(QMainWindow):
         self._create_central_tabs()
         self._init_update_checker()
         self._restore_state()
+        QTimer.singleShot(1_500, self._prewarm_quantum)
 
     def _configure_window(self) -> None:
         self.setWindowTitle(self.APPLICATION)
         self.setMinimumSize(1024, 720)
-        self.setWindowIcon(QIcon.fromTheme("applications-science"))
 
     def _create_actions(self) -> None:
-        self.open_action = QAction(QIcon.fromTheme("document-open"), "Open Portfolio", self)
+        # Actions start without icons; theme icon lookups walk the platform
+        # icon cache and are deferred to the first showEvent.
+        self.open_action = QAction("Open Portfolio", self)
         self.open_action.triggered.connect(self._open_portfolio)
 
-        self.save_action = QAction(QIcon.fromTheme("document-save"), "Save Portfolio", self)
+        self.save_action = QAction("Save Portfolio", self)
         self.save_action.triggered.connect(self._save_portfolio)
 
         self.exit_action = QAction("Exit", self)
@@ -73,9 +147,21 @@ class MainWindow(QMainWindow):
         self.about_action = QAction("About", self)
         self.about_action.triggered.connect(self._show_about_dialog)
 
-        self.refresh_backend_action = QAction(QIcon.fromTheme("view-refresh"), "Refresh Backend", self)
+        self.refresh_backend_action = QAction("Refresh Backend", self)
         self.refresh_backend_action.triggered.connect(self._refresh_backend_status)
 
+    def _attach_icons(self) -> None:
+        self.setWindowIcon(QIcon.fromTheme("applications-science"))
+        self.open_action.setIcon(QIcon.fromTheme("document-open"))
+        self.save_action.setIcon(QIcon.fromTheme("document-save"))
+        self.refresh_backend_action.setIcon(QIcon.fromTheme("view-refresh"))
+
+    def showEvent(self, event) -> None:  # noqa: N802 - Qt API
+        super().showEvent(event)
+        if not self._icons_attached:
+            self._icons_attached = True
+            self._attach_icons()
+
     def _create_menus(self) -> None:
         file_menu = self.menuBar().addMenu("&File")
         file_menu.addAction(self.open_action)
@@ -119,30 +205,76 @@ class MainWindow(QMainWindow):
         self.tabs.setDocumentMode(True)
         self.tabs.setTabPosition(QTabWidget.TabPosition.North)
 
+        # Only the Portfolio tab (and the cheap placeholder) are built before
+        # show(); the remaining tabs materialize on first activation.
         self.portfolio_widget = PortfolioWidget(self)
         self.market_data_widget = self._build_placeholder_widget(
             "Market Data Tools",
             "Connect to Yahoo Finance and Alpha Vantage to sync historical and realtime datasets.",
         )
-        self.quantum_widget = QuantumWidget(self.backend_manager, self)
-        self.results_widget = ResultsWidget(self)
-        self.analytics_widget = AnalyticsWidget(self)
         self.trading_controller = TradingController()
-        self.trading_widget = TradingWidget(self.trading_controller, self)
-        self.trading_widget.set_manual_override_callback(self._handle_manual_override)
+        self.quantum_widget: QuantumWidget | None = None
+        self.results_widget: ResultsWidget | None = None
+        self.analytics_widget: AnalyticsWidget | None = None
+        self.trading_widget: TradingWidget | None = None
 
         self.tabs.addTab(self.portfolio_widget, "Portfolio Management")
         self.tabs.addTab(self.market_data_widget, "Market Data")
-        self.tabs.addTab(self.quantum_widget, "Quantum Computing")
-        self.tabs.addTab(self.results_widget, "Results")
-        self.tabs.addTab(self.analytics_widget, "Analytics")
-        self.tabs.addTab(self.trading_widget, "Trading")
+        self.tabs.addTab(_LazyTab(self._build_quantum_tab, self), "Quantum Computing")
+        self.tabs.addTab(_LazyTab(self._build_results_tab, self), "Results")
+        self.tabs.addTab(_LazyTab(self._build_analytics_tab, self), "Analytics")
+        self.tabs.addTab(_LazyTab(self._build_trading_tab, self), "Trading")
+        self.tabs.currentChanged.connect(self._materialize_tab)
 
         self.setCentralWidget(self.tabs)
 
         if self.trading_controller.has_credentials():
             self.trading_controller.connect_to_alpaca()
 
+    def _build_quantum_tab(self) -> QWidget:
+        from .widgets import QuantumWidget
+
+        self.quantum_widget = QuantumWidget(self.backend_manager, self)
+        return self.quantum_widget
+
+    def _build_results_tab(self) -> QWidget:
+        from .widgets import ResultsWidget
+
+        self.results_widget = ResultsWidget(self)
+        return self.results_widget
+
+    def _build_analytics_tab(self) -> QWidget:
+        from .widgets import AnalyticsWidget
+
+        self.analytics_widget = AnalyticsWidget(self)
+        return self.analytics_widget
+
+    def _build_trading_tab(self) -> QWidget:
+        from .widgets import TradingWidget
+
+        self.trading_widget = TradingWidget(self.trading_controller, self)
+        self.trading_widget.set_manual_override_callback(self._handle_manual_override)
+        return self.trading_widget
+
+    def _materialize_tab(self, index: int) -> None:
+        page = self.tabs.widget(index)
+        if not isinstance(page, _LazyTab):
+            return
+        label = self.tabs.tabText(index)
+        real = page.factory()
+        # Removing the current tab makes Qt select a neighbour and re-emit
+        # currentChanged synchronously, which would re-enter this handler
+        # and cascade-materialize every remaining lazy tab; silence the
+        # widget for the swap so only the requested tab is built.
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, real, label)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        page.deleteLater()
+
     def _build_placeholder_widget(self, title: str, description: str) -> QWidget:
         widget = QWidget(self)
         layout = QVBoxLayout(widget)
@@ -154,7 +286,9 @@ class MainWindow(QMainWindow):
         return widget
 
     def apply_theme(self, theme: str) -> None:
-        app = QApplication.instance()
+        if theme == self._theme and self._theme_applied:
+            return
+        app = self._app
         if app is None:
             return
         if theme == "dark":
@@ -166,19 +300,37 @@ class MainWindow(QMainWindow):
             self.theme_light_action.setChecked(True)
             self.theme_dark_action.setChecked(False)
         self._theme = theme
-        self.settings.setValue("ui/theme", theme)
+        self._theme_applied = True
+        self._settings_cache["ui/theme"] = theme
 
     def _refresh_backend_status(self) -> None:
-        try:
-            service = self.backend_manager._authenticate()  # type: ignore[attr-defined]
-            if service is None:
-                self._status_label.setText("Backend: Aer Simulator")
-            else:
-                backend_name = self.backend_manager._select_backend(service, num_qubits=5, prefer_hardware=False)
-                self._status_label.setText(f"Backend: {backend_name}")
-        except Exception as exc:
-            logger.error("Failed to refresh backend status: {}", exc)
-            self._status_label.setText("Backend: Unavailable")
+        probe = _BackendProbe(self.backend_manager)
+        probe.signals.done.connect(self._status_label.setText)
+        # Keep a reference so the signal holder outlives the pool hand-off.
+        self._backend_probe = probe
+        QThreadPool.globalInstance().start(probe)
+
+    def _prewarm_quantum(self) -> None:
+        # The first real optimization pays qiskit import plus solver warmup;
+        # run a toy problem on the pool so that cost lands before the user
+        # clicks "Run Optimization". Imports stay deferred to this point so
+        # the prewarm itself never slows window construction.
+        from quantum_engine.qaoa_optimizer import QuantumPortfolioOptimizer
+
+        from .workers.quantum_worker import QuantumWorker
+
+        worker = QuantumWorker(
+            optimizer=QuantumPortfolioOptimizer(num_layers=1),
+            returns=[0.01, 0.01],
+            covariances=[[1e-4, 0.0], [0.0, 1e-4]],
+            budget=1.0,
+            sector_limits=None,
+            shots=1,
+            prewarm=True,
+        )
+        # Keep a reference so the worker outlives the pool hand-off.
+        self._quantum_prewarm = worker
+        QThreadPool.globalInstance().start(worker)
 
     def _init_update_checker(self) -> None:
         manifest_url = os.getenv("QPO_UPDATE_URL")
@@ -201,9 +353,21 @@ class MainWindow(QMainWindow):
         )
         QTimer.singleShot(5_000, self.update_checker.check_async)
 
+    def _post_status(self, message: str, timeout: int = 5_000) -> None:
+        self._pending_status = (message, timeout)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self) -> None:
+        if self._pending_status is None:
+            return
+        message, timeout = self._pending_status
+        self._pending_status = None
+        self.statusBar().showMessage(message, timeout)
+
     def _notify_update_available(self, info) -> None:
         message = f"Update {info.version} available. Release notes: {info.release_notes}"
-        self.statusBar().showMessage(message, 15_000)
+        self._post_status(message, 15_000)
 
     def _handle_manual_override(self) -> None:
         QMessageBox.information(
@@ -220,7 +384,7 @@ class MainWindow(QMainWindow):
             "JSON Files (*.json)",
         )
         if file_path:
-            self.statusBar().showMessage(f"Loaded portfolio from {file_path}", 5_000)
+            self._post_status(f"Loaded portfolio from {file_path}")
 
     def _save_portfolio(self) -> None:
         file_path, _ = QFileDialog.getSaveFileName(
@@ -230,7 +394,7 @@ class MainWindow(QMainWindow):
             "JSON Files (*.json)",
         )
         if file_path:
-            self.statusBar().showMessage(f"Saved portfolio to {file_path}", 5_000)
+            self._post_status(f"Saved portfolio to {file_path}")
 
     def _show_about_dialog(self) -> None:
         QMessageBox.about(
@@ -242,19 +406,23 @@ class MainWindow(QMainWindow):
         )
 
     def _restore_state(self) -> None:
-        geometry = self.settings.value("ui/geometry")
-        window_state = self.settings.value("ui/window_state")
-        theme = self.settings.value("ui/theme", "light")
+        geometry = self._settings_cache["ui/geometry"]
+        window_state = self._settings_cache["ui/window_state"]
+        theme = self._settings_cache["ui/theme"] or "light"
 
-        if geometry:
+        if not geometry.isEmpty():
             self.restoreGeometry(geometry)
-        if window_state:
+        if not window_state.isEmpty():
             self.restoreState(window_state)
 
         self.apply_theme(str(theme))
 
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802 - Qt API
-        self.settings.setValue("ui/geometry", self.saveGeometry())
-        self.settings.setValue("ui/window_state", self.saveState())
+        self._settings_cache["ui/geometry"] = self.saveGeometry()
+        self._settings_cache["ui/window_state"] = self.saveState()
+        for key, value in self._settings_cache.items():
+            if value != self._settings_cache_orig.get(key):
+                self.settings.setValue(key, value)
+        self.settings.sync()
         super().closeEvent(event)
 
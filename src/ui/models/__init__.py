@@ -0,0 +1,5 @@
+"""Item models backing the UI views."""
+
+from .trading_table_model import TradingTableModel
+
+__all__ = ["TradingTableModel"]
@@ -0,0 +1,142 @@
+"""Table models backing the trading interface views."""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class TradingTableModel(QAbstractTableModel):
+    """Flat list-of-tuples model for the trading tables.
+
+    A refresh swaps the row storage under a single model reset and the
+    view paints straight from the tuples, instead of allocating one
+    QTableWidgetItem per cell per tick.
+    """
+
+    def __init__(self, headers: Sequence[str], parent=None, *, key_header: str | None = None) -> None:
+        super().__init__(parent)
+        self._headers: tuple[str, ...] = tuple(headers)
+        self._rows: list[tuple] = []
+        # Column used to match snapshot rows against existing ones so
+        # refreshes patch in place instead of resetting the whole model.
+        self._key_col = self._headers.index(key_header) if key_header else None
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel interface
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+    # ------------------------------------------------------------------
+    # Update API
+    # ------------------------------------------------------------------
+    def replace(self, rows: Iterable[Mapping[str, object]]) -> None:
+        """Swap in a full snapshot of mapping rows under one reset."""
+
+        headers = self._headers
+        self.beginResetModel()
+        self._rows = [
+            tuple(str(row.get(header, "")) for header in headers) for row in rows
+        ]
+        self.endResetModel()
+
+    @property
+    def headers(self) -> tuple[str, ...]:
+        return self._headers
+
+    def apply_snapshot(self, rows: Iterable[Mapping[str, object]]) -> None:
+        """Patch the model against a fresh snapshot of mapping rows."""
+
+        headers = self._headers
+        self.apply_snapshot_tuples(
+            [tuple(str(row.get(header, "")) for header in headers) for row in rows]
+        )
+
+    def apply_snapshot_tuples(self, new_rows: list[tuple]) -> None:
+        """Patch the model against already-stringified row tuples.
+
+        Rows matched through the key column are updated via dataChanged,
+        vanished keys are removed, and new keys are appended in one
+        insert block. Falls back to a full reset when no key column was
+        configured. Keeping updates incremental preserves the view's
+        selection and scroll position across controller ticks.
+        """
+
+        key_col = self._key_col
+        if key_col is None:
+            self.beginResetModel()
+            self._rows = new_rows
+            self.endResetModel()
+            return
+
+        new_by_key = {row[key_col]: row for row in new_rows}
+        if len(new_by_key) != len(new_rows) or len(
+            {row[key_col] for row in self._rows}
+        ) != len(self._rows):
+            # Duplicate keys (rebalance previews all carry "-" as their
+            # order id) make the keyed diff ambiguous and would leave
+            # stale rows behind; swap the whole snapshot instead.
+            self.beginResetModel()
+            self._rows = new_rows
+            self.endResetModel()
+            return
+
+        for idx in range(len(self._rows) - 1, -1, -1):
+            if self._rows[idx][key_col] not in new_by_key:
+                self.beginRemoveRows(QModelIndex(), idx, idx)
+                del self._rows[idx]
+                self.endRemoveRows()
+
+        last_col = len(self._headers) - 1
+        index_by_key = {row[key_col]: idx for idx, row in enumerate(self._rows)}
+        for key, new_row in new_by_key.items():
+            idx = index_by_key.get(key)
+            if idx is not None and self._rows[idx] != new_row:
+                self._rows[idx] = new_row
+                self.dataChanged.emit(self.index(idx, 0), self.index(idx, last_col))
+
+        self.append_rows(
+            row for row in new_rows if row[key_col] not in index_by_key
+        )
+
+    def append_row(self, row: tuple) -> None:
+        self.append_rows([row])
+
+    def append_rows(self, rows: Iterable[tuple]) -> None:
+        """Append a batch of tuples under one insert notification."""
+
+        batch = list(rows)
+        if not batch:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._rows.extend(batch)
+        self.endInsertRows()
+
+    def remove_head(self, count: int) -> None:
+        """Drop the oldest ``count`` rows in one remove notification."""
+
+        if count <= 0:
+            return
+        count = min(count, len(self._rows))
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        del self._rows[:count]
+        self.endRemoveRows()
+
+
+__all__ = ["TradingTableModel"]
@@ -11,8 +11,26 @@ class Theme:
 
     BASE_FONT = QFont("Helvetica Neue", 10)
 
+    _dark_palette: QPalette | None = None
+    _light_palette: QPalette | None = None
+    _stylesheet_installed = False
+
     @classmethod
     def apply_dark_theme(cls, app: QApplication) -> None:
+        if cls._dark_palette is None:
+            cls._dark_palette = cls._build_dark_palette()
+        app.setPalette(cls._dark_palette)
+        cls._apply_common_styles(app)
+
+    @classmethod
+    def apply_light_theme(cls, app: QApplication) -> None:
+        if cls._light_palette is None:
+            cls._light_palette = cls._build_light_palette()
+        app.setPalette(cls._light_palette)
+        cls._apply_common_styles(app)
+
+    @staticmethod
+    def _build_dark_palette() -> QPalette:
         palette = QPalette()
         palette.setColor(QPalette.ColorRole.Window, QColor(30, 30, 35))
         palette.setColor(QPalette.ColorRole.WindowText, QColor(220, 220, 220))
@@ -27,12 +45,10 @@ class Theme:
         palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
         palette.setColor(QPalette.ColorRole.Link, QColor(100, 180, 255))
         palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 85, 85))
+        return palette
 
-        app.setPalette(palette)
-        cls._apply_common_styles(app)
-
-    @classmethod
-    def apply_light_theme(cls, app: QApplication) -> None:
+    @staticmethod
+    def _build_light_palette() -> QPalette:
         palette = QPalette()
         palette.setColor(QPalette.ColorRole.Window, QColor(246, 248, 252))
         palette.setColor(QPalette.ColorRole.WindowText, QColor(25, 25, 25))
@@ -47,12 +63,15 @@ class Theme:
         palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
         palette.setColor(QPalette.ColorRole.Link, QColor(34, 112, 224))
         palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 85, 85))
-
-        app.setPalette(palette)
-        cls._apply_common_styles(app)
+        return palette
 
     @classmethod
     def _apply_common_styles(cls, app: QApplication) -> None:
+        # The stylesheet and base font are theme-independent; installing the
+        # QSS forces Qt to rebuild its selector tables, so do it once.
+        if cls._stylesheet_installed:
+            return
+        cls._stylesheet_installed = True
         app.setFont(cls.BASE_FONT)
         app.setStyleSheet(
             """
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Optional
 
 from PySide6.QtCore import QObject, Signal
@@ -11,6 +12,7 @@ class SignalManager(QObject):
     """Singleton object broadcasting application-wide signals."""
 
     _instance: Optional["SignalManager"] = None
+    _lock = threading.Lock()
 
     quantum_job_started = Signal(str)
     quantum_job_progress = Signal(int, str)
@@ -23,13 +25,11 @@ class SignalManager(QObject):
 
     notification = Signal(str, str)  # level, message
 
-    def __new__(cls, *args, **kwargs) -> "SignalManager":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(self) -> None:
-        if getattr(self, "_initialized", False):  # pragma: no cover - defensive
+        # Idempotent: Python re-runs __init__ on every construction of the
+        # shared instance, and re-initializing a QObject resets its
+        # connection state.
+        if getattr(self, "_initialized", False):
             return
         super().__init__()
         self._initialized = True
@@ -37,7 +37,9 @@ class SignalManager(QObject):
     @classmethod
     def instance(cls) -> "SignalManager":
         if cls._instance is None:
-            cls._instance = cls()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
         return cls._instance
 
 
@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import hashlib
 import json
-import threading
+import os
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
+from urllib.request import urlopen
 
-import requests
 from loguru import logger
+from packaging.version import InvalidVersion, Version
+from PySide6.QtCore import QUrl
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 
 
 @dataclass(slots=True)
@@ -35,30 +39,40 @@ class UpdateChecker:
         self.current_version = current_version
         self.download_dir = download_dir
         self.notifier = notifier
+        try:
+            self._current_version = Version(current_version)
+        except InvalidVersion:
+            self._current_version = Version("0.0.0")
+        self._nam = QNetworkAccessManager()
 
     def check_async(self) -> None:
-        thread = threading.Thread(target=self._run, name="UpdateChecker", daemon=True)
-        thread.start()
+        """Fetch the manifest on the Qt event loop; completion stays on the UI thread."""
+
+        reply = self._nam.get(QNetworkRequest(QUrl(self.manifest_url)))
+        reply.finished.connect(lambda: self._on_manifest(reply))
 
-    def _run(self) -> None:
+    def _on_manifest(self, reply: QNetworkReply) -> None:
         try:
-            response = requests.get(self.manifest_url, timeout=10)
-            response.raise_for_status()
-            manifest = response.json()
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise RuntimeError(reply.errorString())
+            manifest = json.loads(bytes(reply.readAll().data()).decode("utf-8"))
             info = self._parse_manifest(manifest)
             if info and self._is_newer(info.version) and self.notifier:
                 self.notifier(info)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Update check failed: {}", exc)
+        finally:
+            reply.deleteLater()
 
     def download_update(self, info: UpdateInfo) -> Path:
         self.download_dir.mkdir(parents=True, exist_ok=True)
         target = self.download_dir / f"update-{info.version}.bin"
-        with requests.get(info.download_url, stream=True, timeout=30) as response:
-            response.raise_for_status()
-            with open(target, "wb") as handle:
-                for chunk in response.iter_content(chunk_size=8192):
-                    handle.write(chunk)
+        with urlopen(info.download_url, timeout=30) as response, open(target, "wb") as handle:
+            shutil.copyfileobj(response, handle, length=1 << 20)
+            handle.flush()
+            if hasattr(os, "posix_fadvise"):
+                # Don't let a large download evict hot pages from the cache.
+                os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         if not self._verify_checksum(target, info.checksum):
             target.unlink(missing_ok=True)
             raise ValueError("Downloaded file checksum mismatch")
@@ -78,21 +92,18 @@ class UpdateChecker:
         )
 
     def _is_newer(self, remote_version: str) -> bool:
-        def parse(version: str) -> tuple[int, ...]:
-            return tuple(int(part) for part in version.split("."))
-
         try:
-            return parse(remote_version) > parse(self.current_version)
-        except ValueError:
+            return Version(remote_version) > self._current_version
+        except InvalidVersion:
             return False
 
     def _verify_checksum(self, file_path: Path, checksum: str) -> bool:
         if not checksum:
             return True
-        digest = hashlib.sha256()
         with open(file_path, "rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                digest.update(chunk)
+            # hashlib.file_digest streams through a large internal buffer and
+            # OpenSSL's hardware-accelerated SHA-256 kernel.
+            digest = hashlib.file_digest(handle, "sha256")
         return digest.hexdigest() == checksum
 
 
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+import warnings
 from typing import Iterable
 
+import numpy as np
 from PySide6.QtGui import QDoubleValidator, QValidator
 
 
@@ -12,12 +14,16 @@ class StockSymbolValidator(QValidator):
     """Validate stock symbols consisting of letters, numbers, and separators."""
 
     pattern = re.compile(r"^[A-Z]{1,5}(\.[A-Z]{1,2})?$")
+    _match = pattern.match
 
     def validate(self, input_str: str, pos: int):  # type: ignore[override]
         if not input_str:
             return QValidator.State.Intermediate, input_str, pos
-        if self.pattern.match(input_str.upper()):
-            return QValidator.State.Acceptable, input_str.upper(), pos
+        # Skip the .upper() allocation when the user already types uppercase
+        # (the common case); this runs on every keystroke.
+        symbol = input_str if input_str.isupper() else input_str.upper()
+        if self._match(symbol):
+            return QValidator.State.Acceptable, symbol, pos
         return QValidator.State.Invalid, input_str, pos
 
 
@@ -58,15 +64,22 @@ class PortfolioConstraintValidator(QValidator):
         self.tolerance = tolerance
 
     def validate(self, input_str: str, pos: int):  # type: ignore[override]
+        if not input_str.strip():
+            return QValidator.State.Intermediate, input_str, pos
+
         try:
-            allocations = [float(value.strip()) for value in input_str.split(",") if value.strip()]
-        except ValueError:
+            with warnings.catch_warnings():
+                # np.fromstring warns instead of raising on partial parses;
+                # treat that exactly like the old float() ValueError.
+                warnings.simplefilter("error")
+                allocations = np.fromstring(input_str, dtype=np.float64, sep=",")
+        except (ValueError, Warning):
             return QValidator.State.Invalid, input_str, pos
 
-        if not allocations:
+        if allocations.size == 0:
             return QValidator.State.Intermediate, input_str, pos
 
-        total = sum(allocations)
+        total = float(allocations.sum())
         if abs(total - self.expected_sum) <= self.tolerance:
             return QValidator.State.Acceptable, input_str, pos
         if total < self.expected_sum:
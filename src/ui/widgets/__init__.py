@@ -1,10 +1,6 @@
 """Reusable Qt widgets for the Quantum Portfolio Optimizer UI."""
 
-from .analytics_widget import AnalyticsWidget
-from .portfolio_widget import PortfolioWidget
-from .quantum_widget import QuantumWidget
-from .results_widget import ResultsWidget
-from .trading_widget import TradingWidget
+import importlib
 
 __all__ = [
     "PortfolioWidget",
@@ -14,3 +10,31 @@ __all__ = [
     "TradingWidget",
 ]
 
+# PEP 562 lazy re-exports: AnalyticsWidget alone pulls in matplotlib and
+# pandas, so widget modules only load when their class is first touched.
+_LAZY_WIDGETS = {
+    "AnalyticsWidget": "analytics_widget",
+    "PortfolioWidget": "portfolio_widget",
+    "QuantumWidget": "quantum_widget",
+    "ResultsWidget": "results_widget",
+    "TradingWidget": "trading_widget",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_WIDGETS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# Every lazily-exported widget must stay listed in __all__ (and vice versa)
+# so no re-export silently drops out of the public surface again.
+assert set(__all__) == set(_LAZY_WIDGETS)
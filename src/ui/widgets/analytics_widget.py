@@ -37,8 +37,8 @@ class AnalyticsWidget(QWidget):
 
     def _build_chart_section(self) -> QHBoxLayout:
         section = QHBoxLayout()
-        self.performance_canvas = self._create_canvas()
-        self.drawdown_canvas = self._create_canvas()
+        self.performance_canvas, self._perf_ax = self._create_canvas()
+        self.drawdown_canvas, self._dd_ax = self._create_canvas()
 
         perf_group = QGroupBox("Performance")
         perf_layout = QVBoxLayout(perf_group)
@@ -64,9 +64,12 @@ class AnalyticsWidget(QWidget):
         section.addWidget(self.benchmark_table)
         return section
 
-    def _create_canvas(self) -> FigureCanvasQTAgg:
+    def _create_canvas(self) -> tuple[FigureCanvasQTAgg, object]:
+        # The Axes is created once and reused across redraws; calling
+        # figure.subplots() per update would keep adding Axes to the figure.
         figure = Figure(figsize=(5, 3), tight_layout=True)
-        return FigureCanvasQTAgg(figure)
+        canvas = FigureCanvasQTAgg(figure)
+        return canvas, figure.add_subplot(111)
 
     def _create_table(self, title: str) -> QGroupBox:
         group = QGroupBox(title)
@@ -77,6 +80,7 @@ class AnalyticsWidget(QWidget):
         table.verticalHeader().setVisible(False)
         table.setAlternatingRowColors(True)
         layout.addWidget(table)
+        table.item_pool = []  # type: ignore[attr-defined]
         group.table = table  # type: ignore[attr-defined]
         return group
 
@@ -98,36 +102,72 @@ class AnalyticsWidget(QWidget):
     # Helpers
     # ------------------------------------------------------------------
     def _populate_table(self, table: QTableWidget, metrics: Mapping[str, float | str]) -> None:
-        table.setRowCount(len(metrics))
-        for row, (key, value) in enumerate(metrics.items()):
-            table.setItem(row, 0, QTableWidgetItem(str(key)))
-            if isinstance(value, (int, float, np.number)):
-                display = f"{float(value):.4f}"
-            else:
-                display = str(value)
-            table.setItem(row, 1, QTableWidgetItem(display))
+        # Reuse a pool of items sized to the largest update seen so far;
+        # steady-state refreshes only call setText instead of churning new
+        # QTableWidgetItem C++ objects through setRowCount.
+        pool: list[tuple[QTableWidgetItem, QTableWidgetItem]] = table.item_pool  # type: ignore[attr-defined]
+        count = len(metrics)
+        # Sorting would re-rank rows after every setText while the table
+        # is mid-populate; disable it for the batch and restore after.
+        was_sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            if table.rowCount() < count:
+                table.setRowCount(count)
+            while len(pool) < count:
+                row = len(pool)
+                key_item = QTableWidgetItem()
+                value_item = QTableWidgetItem()
+                table.setItem(row, 0, key_item)
+                table.setItem(row, 1, value_item)
+                pool.append((key_item, value_item))
+            for row, ((key_item, value_item), (key, value)) in enumerate(
+                zip(pool, metrics.items())
+            ):
+                key_item.setText(str(key))
+                value_item.setText(
+                    f"{float(value):.4f}"
+                    if isinstance(value, (int, float, np.number))
+                    else str(value)
+                )
+                table.setRowHidden(row, False)
+            for row in range(count, len(pool)):
+                table.setRowHidden(row, True)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(was_sorting)
 
     def _plot_performance(self, returns: pd.DataFrame) -> None:
-        ax = self.performance_canvas.figure.subplots()
+        ax = self._perf_ax
         ax.clear()
-        cumulative = (1 + returns.fillna(0)).cumprod()
-        cumulative.plot(ax=ax)
+        # Plot raw NumPy columns; pandas' plotting wrapper introspects dtypes
+        # and rebuilds its legend machinery on every call.
+        cumulative = np.cumprod(1.0 + returns.fillna(0).to_numpy(), axis=0)
+        index = returns.index
+        for column, name in enumerate(returns.columns):
+            ax.plot(index, cumulative[:, column], label=str(name))
         ax.set_title("Cumulative Returns")
         ax.set_ylabel("Growth of $1")
         ax.legend(loc="upper left")
-        self.performance_canvas.draw()
+        self.performance_canvas.draw_idle()
 
     def _plot_drawdown(self, portfolio_returns: pd.Series) -> None:
-        ax = self.drawdown_canvas.figure.subplots()
+        ax = self._dd_ax
         ax.clear()
-        cumulative = (1 + portfolio_returns.fillna(0)).cumprod()
-        running_max = cumulative.cummax()
-        drawdown = cumulative / running_max - 1
-        drawdown.plot(ax=ax, color="tab:red")
+        # Single-pass NumPy kernels avoid the three intermediate Series the
+        # pandas cumprod/cummax/divide chain would allocate.
+        returns = np.asarray(portfolio_returns.fillna(0).values, dtype=np.float64)
+        cumulative = np.cumprod(1.0 + returns)
+        drawdown = cumulative / np.maximum.accumulate(cumulative) - 1.0
+        index = portfolio_returns.index
+        ax.plot(index, drawdown, color="tab:red")
         ax.set_title("Drawdown")
         ax.set_ylabel("Drawdown")
-        ax.fill_between(drawdown.index, drawdown.values, color="tab:red", alpha=0.2)
-        self.drawdown_canvas.draw()
+        ax.fill_between(index, drawdown, color="tab:red", alpha=0.2)
+        self.drawdown_canvas.draw_idle()
 
 
 __all__ = ["AnalyticsWidget"]
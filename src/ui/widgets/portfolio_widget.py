@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import math
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 from loguru import logger
-from PySide6.QtCore import Qt, QStringListModel
+from PySide6.QtCore import Qt, QStringListModel, QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QCompleter,
@@ -31,6 +34,21 @@ from PySide6.QtWidgets import (
 from ..utils.signal_manager import SignalManager
 
 
+# Shared by every numeric cell; OR-ing the flags per item re-runs the
+# enum machinery each time.
+_ALIGN_RIGHT_V = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Matches what the numeric cells accept; testing with this first keeps the
+# ValueError machinery off the per-keystroke path while a value is half-typed.
+_NUMERIC_RE = re.compile(r"^-?\d+(?:\.\d+)?$")
+
+
+@functools.lru_cache(maxsize=32)
+def _icon(name: str) -> QIcon:
+    # Theme lookups walk the XDG icon directories on Linux; memoize so
+    # rebuilding a widget never repeats the filesystem traversal.
+    return QIcon.fromTheme(name)
+
 COMMON_TICKERS = [
     "AAPL",
     "MSFT",
@@ -64,6 +82,17 @@ class PortfolioWidget(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._signal_manager = SignalManager.instance()
+        # Gathered rows are cached until the table changes, and summary
+        # recomputes are debounced so edit bursts collapse into one pass.
+        self._portfolio_cache: list[dict[str, float | str]] | None = None
+        # Mirrors column 0 so the duplicate check on add is a hash lookup
+        # instead of a Qt round-trip per existing row.
+        self._symbol_set: set[str] = set()
+        self._last_payload_hash: int | None = None
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(50)
+        self._summary_timer.timeout.connect(self._recompute_and_broadcast)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -88,7 +117,7 @@ class PortfolioWidget(QWidget):
 
         add_button = QPushButton("Add Asset")
         add_button.clicked.connect(self._handle_symbol_submit)
-        add_button.setIcon(QIcon.fromTheme("list-add"))
+        add_button.setIcon(_icon("list-add"))
 
         row = QHBoxLayout()
         row.addWidget(QLabel("Symbol:"))
@@ -151,11 +180,11 @@ class PortfolioWidget(QWidget):
     def _build_action_buttons(self) -> QHBoxLayout:
         save_btn = QPushButton("Save Portfolio")
         save_btn.clicked.connect(self._save_portfolio)
-        save_btn.setIcon(QIcon.fromTheme("document-save"))
+        save_btn.setIcon(_icon("document-save"))
 
         load_btn = QPushButton("Load Portfolio")
         load_btn.clicked.connect(self._load_portfolio)
-        load_btn.setIcon(QIcon.fromTheme("document-open"))
+        load_btn.setIcon(_icon("document-open"))
 
         row = QHBoxLayout()
         row.addStretch(1)
@@ -168,56 +197,82 @@ class PortfolioWidget(QWidget):
         if not symbol:
             return
 
-        existing_symbols = [self.table.item(row, 0).text() for row in range(self.table.rowCount())]
-        if symbol in existing_symbols:
+        if symbol in self._symbol_set:
             logger.warning("Symbol {} already exists in portfolio", symbol)
             self.symbol_input.clear()
             return
 
+        self._symbol_set.add(symbol)
         row_position = self.table.rowCount()
         self.table.insertRow(row_position)
         self.table.setItem(row_position, 0, QTableWidgetItem(symbol))
         self.table.setItem(row_position, 1, self._create_numeric_item("10.0"))
         self.table.setItem(row_position, 2, self._create_numeric_item("8.0"))
         self.symbol_input.clear()
+        self._invalidate_portfolio()
         self._update_summary()
 
     def _create_numeric_item(self, value: str) -> QTableWidgetItem:
         item = QTableWidgetItem(value)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        item.setTextAlignment(_ALIGN_RIGHT_V)
         return item
 
     def _handle_table_change(self, item: QTableWidgetItem) -> None:
+        self._invalidate_portfolio()
         if item.column() == 0:
             item.setText(item.text().strip().upper())
+            # The edited cell's previous value is gone by now, so rebuild the
+            # mirror; symbol edits are rare next to numeric tweaks.
+            self._rebuild_symbol_set()
             self._update_summary()
             return
 
-        try:
-            float(item.text())
-        except ValueError:
-            logger.error("Invalid numeric input: {}", item.text())
+        text = item.text()
+        if not _NUMERIC_RE.match(text):
+            logger.error("Invalid numeric input: {}", text)
             item.setText("0.0")
-        finally:
-            self._update_summary()
+        self._update_summary()
+
+    def _invalidate_portfolio(self) -> None:
+        self._portfolio_cache = None
+
+    def _rebuild_symbol_set(self) -> None:
+        item = self.table.item
+        self._symbol_set = {
+            item(row, 0).text()
+            for row in range(self.table.rowCount())
+            if item(row, 0) is not None
+        }
 
     def _gather_portfolio_data(self) -> list[dict[str, float | str]]:
+        if self._portfolio_cache is None:
+            self._collect_rows()
+        return self._portfolio_cache or []
+
+    def _collect_rows(self) -> tuple[float, float]:
+        """Traverse the table once, caching row dicts and returning totals."""
+
+        item = self.table.item
         portfolio: list[dict[str, float | str]] = []
+        total_allocation = 0.0
+        weighted_return = 0.0
         for row in range(self.table.rowCount()):
-            symbol_item = self.table.item(row, 0)
-            allocation_item = self.table.item(row, 1)
-            return_item = self.table.item(row, 2)
+            symbol_item = item(row, 0)
             if not symbol_item:
                 continue
             symbol = symbol_item.text().strip().upper()
             if not symbol:
                 continue
+            allocation_item = item(row, 1)
+            return_item = item(row, 2)
             try:
                 allocation = float(allocation_item.text()) if allocation_item else 0.0
                 expected_return = float(return_item.text()) if return_item else 0.0
             except (ValueError, AttributeError):
                 allocation = 0.0
                 expected_return = 0.0
+            total_allocation += allocation
+            weighted_return += allocation * expected_return
             portfolio.append(
                 {
                     "symbol": symbol,
@@ -225,17 +280,33 @@ class PortfolioWidget(QWidget):
                     "expected_return": expected_return,
                 }
             )
-        return portfolio
+        self._portfolio_cache = portfolio
+        return total_allocation, weighted_return
 
     def _update_summary(self) -> None:
-        portfolio = self._gather_portfolio_data()
+        """Schedule a debounced summary recompute."""
+
+        self._summary_timer.start()
+
+    def _recompute_and_broadcast(self) -> None:
+        # Gather, summarize, and broadcast off a single table traversal;
+        # the old three-method split walked the same rows three times.
+        if self._portfolio_cache is None:
+            total_allocation, weighted_return = self._collect_rows()
+        else:
+            total_allocation = math.fsum(
+                asset["allocation"] for asset in self._portfolio_cache
+            )
+            weighted_return = math.fsum(
+                asset["allocation"] * asset["expected_return"]
+                for asset in self._portfolio_cache
+            )
+        portfolio = self._portfolio_cache or []
+
         if not portfolio:
             summary = PortfolioSummary(0.0, 0.0, 0.0)
         else:
-            allocations = np.array([asset["allocation"] for asset in portfolio], dtype=float)
-            returns = np.array([asset["expected_return"] for asset in portfolio], dtype=float)
-            total_allocation = allocations.sum()
-            normalized_returns = np.dot(allocations, returns) / max(total_allocation, 1.0)
+            normalized_returns = weighted_return / max(total_allocation, 1.0)
             risk_score = float(self.risk_slider.value()) / 100 + float(self.constraint_slider.value()) / 120
             summary = PortfolioSummary(total_allocation, normalized_returns, risk_score)
 
@@ -267,7 +338,10 @@ class PortfolioWidget(QWidget):
         }
 
         try:
-            Path(file_path).write_text(json.dumps(payload, indent=2))
+            # Stream straight to the file; dumps() would materialize the
+            # whole document as a string first.
+            with Path(file_path).open("w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2)
             logger.success("Portfolio saved to {}", file_path)
         except OSError as exc:
             logger.error("Failed to save portfolio: {}", exc)
@@ -288,20 +362,31 @@ class PortfolioWidget(QWidget):
             logger.error("Failed to load portfolio: {}", exc)
             return
 
-        self.table.setRowCount(0)
-        for asset in data.get("assets", []):
-            symbol = str(asset.get("symbol", "")).upper()
-            allocation = float(asset.get("allocation", 0.0))
-            expected_return = float(asset.get("expected_return", 0.0))
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            self.table.setItem(row_position, 0, QTableWidgetItem(symbol))
-            self.table.setItem(row_position, 1, self._create_numeric_item(f"{allocation:.2f}"))
-            self.table.setItem(row_position, 2, self._create_numeric_item(f"{expected_return:.2f}"))
+        assets = data.get("assets", [])
+        # Every setItem below would otherwise fire itemChanged and schedule
+        # a summary recompute per cell; suppress the storm and recompute
+        # once after the fill.
+        self.table.blockSignals(True)
+        try:
+            # Size the model once; repeated insertRow shifts existing rows on
+            # every insertion.
+            self.table.setRowCount(len(assets))
+            self._symbol_set.clear()
+            for row, asset in enumerate(assets):
+                symbol = str(asset.get("symbol", "")).upper()
+                self._symbol_set.add(symbol)
+                allocation = float(asset.get("allocation", 0.0))
+                expected_return = float(asset.get("expected_return", 0.0))
+                self.table.setItem(row, 0, QTableWidgetItem(symbol))
+                self.table.setItem(row, 1, self._create_numeric_item(f"{allocation:.2f}"))
+                self.table.setItem(row, 2, self._create_numeric_item(f"{expected_return:.2f}"))
+        finally:
+            self.table.blockSignals(False)
 
         self.risk_slider.setValue(int(data.get("risk_aversion", 50)))
         self.constraint_slider.setValue(int(data.get("constraint", 30)))
         self.max_assets_spin.setValue(int(data.get("max_assets", 10)))
+        self._invalidate_portfolio()
         self._update_summary()
 
     def _broadcast_portfolio(
@@ -310,8 +395,35 @@ class PortfolioWidget(QWidget):
         if not assets:
             return
 
+        # Listeners get the emit synchronously and re-plot on every payload;
+        # skip it entirely when nothing they can see has changed.
+        payload_hash = hash(
+            (
+                tuple(
+                    (asset["symbol"], asset["allocation"], asset["expected_return"])
+                    for asset in assets
+                ),
+                self.risk_slider.value(),
+                self.constraint_slider.value(),
+                self.max_assets_spin.value(),
+            )
+        )
+        if payload_hash == self._last_payload_hash:
+            return
+        self._last_payload_hash = payload_hash
+
+        # Columnar views alongside the asset dicts: consumers doing math
+        # (dot products, normalization) can take the contiguous arrays
+        # instead of re-boxing the dicts per asset.
         payload = {
             "assets": assets,
+            "symbols": [asset["symbol"] for asset in assets],
+            "allocations": np.fromiter(
+                (asset["allocation"] for asset in assets), dtype=np.float64, count=len(assets)
+            ),
+            "returns": np.fromiter(
+                (asset["expected_return"] for asset in assets), dtype=np.float64, count=len(assets)
+            ),
             "risk_aversion": float(self.risk_slider.value()) / 100.0,
             "constraint": float(self.constraint_slider.value()) / 100.0,
             "max_assets": self.max_assets_spin.value(),
@@ -27,12 +27,14 @@ from ..utils.signal_manager import SignalManager
 class QuantumWidget(QWidget):
     """Widget offering IBM Quantum backend interactions."""
 
+    # Mocked job progression. Real integration would query BackendManager.
+    _JOB_STAGES = ("Running", "Optimizing", "Finalizing", "Completed")
+    _STAGE_DELAY_MS = 2_000
+
     def __init__(self, backend_manager: BackendManager | None = None, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.backend_manager = backend_manager or BackendManager()
-        self._job_monitor_timer = QTimer(self)
-        self._job_monitor_timer.setInterval(2_000)
-        self._job_monitor_timer.timeout.connect(self._poll_job_status)
+        self._job_stage = 0
         self._active_job = None
         self._signal_manager = SignalManager.instance()
         self._setup_ui()
@@ -132,10 +134,14 @@ class QuantumWidget(QWidget):
                 return
 
             backends: Iterable[Any] = service.backends()  # type: ignore[misc]
-            for backend in sorted(backends, key=lambda b: b.name):
-                display = f"{backend.name} | qubits={backend.configuration().num_qubits}"
-                item = QListWidgetItem(display)
-                item.setData(Qt.ItemDataRole.UserRole, backend.name)
+            # Decorate-sort-undecorate: .name and .configuration() can hit
+            # the runtime service, so resolve each exactly once instead of
+            # per comparison.
+            rows = [(b.name, b.configuration().num_qubits, b) for b in backends]
+            rows.sort(key=lambda row: row[0])
+            for name, num_qubits, _backend in rows:
+                item = QListWidgetItem(f"{name} | qubits={num_qubits}")
+                item.setData(Qt.ItemDataRole.UserRole, name)
                 self.backend_list.addItem(item)
             self.backend_label.setText("Select a backend")
         except Exception as exc:  # pragma: no cover - UI feedback
@@ -147,43 +153,46 @@ class QuantumWidget(QWidget):
         backend_name = "AerSimulator"
         if selected_item is not None:
             backend_data = selected_item.data(Qt.ItemDataRole.UserRole)
-            backend_name = backend_data or selected_item.text() or backend_name
-        self.backend_label.setText(str(backend_name))
-        self.job_status_label.setText("Submitted")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+            backend_name = str(backend_data or selected_item.text() or backend_name)
 
+        # Snapshot everything the job needs up front; downstream stages read
+        # this dict rather than round-tripping values back out of widgets.
         self._active_job = {
             "backend_name": backend_name,
             "layers": self.layers_spin.value(),
             "iterations": self.iterations_spin.value(),
             "shots": self.shots_spin.value(),
         }
+
+        self.backend_label.setText(backend_name)
+        self.job_status_label.setText("Submitted")
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)
+
         log_quantum_job("submitted", **self._active_job)
-        self._job_monitor_timer.start()
+        self._job_stage = 0
+        QTimer.singleShot(self._STAGE_DELAY_MS, self._advance_job_stage)
 
-    def _poll_job_status(self) -> None:
+    def _advance_job_stage(self) -> None:
+        # Each transition schedules the next single-shot wakeup, so there is
+        # no recurring timer to tick once the sequence finishes and no
+        # read-back of the status label to work out where we are.
         if not self._active_job:
-            self._job_monitor_timer.stop()
             return
 
-        # Mocked job progression. Real integration would query BackendManager.
-        status_sequence = ["Running", "Optimizing", "Finalizing", "Completed"]
-        current = self.job_status_label.text()
-        try:
-            next_status = status_sequence[status_sequence.index(current) + 1]
-        except (ValueError, IndexError):
-            next_status = "Completed"
-
-        self.job_status_label.setText(next_status)
+        status = self._JOB_STAGES[self._job_stage]
+        self.job_status_label.setText(status)
         self.queue_label.setText("0")
         self.wait_time_label.setText("< 1 min")
 
-        if next_status == "Completed":
+        if status == "Completed":
             self.progress_bar.setVisible(False)
-            self._job_monitor_timer.stop()
             log_quantum_job("completed", backend_name=self._active_job.get("backend_name"))
             self._active_job = None
+            return
+
+        self._job_stage += 1
+        QTimer.singleShot(self._STAGE_DELAY_MS, self._advance_job_stage)
 
     def _on_job_started(self, job_id: str) -> None:
         self.progress_bar.setVisible(True)
@@ -7,15 +7,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Sequence
 
-import matplotlib
-
-matplotlib.use("QtAgg")
-
 import numpy as np
 from loguru import logger
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-from matplotlib.figure import Figure
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
     QGridLayout,
@@ -29,6 +23,35 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+_RIGHT_V = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Bound on first canvas construction; importing matplotlib at module scope
+# costs hundreds of ms of UI startup even when this tab is never opened.
+FigureCanvasQTAgg = None
+Figure = None
+
+
+class _ExportSignals(QObject):
+    done = Signal(bool, str)
+
+
+class _ExportTask(QRunnable):
+    """Run a blocking export callable off the UI thread."""
+
+    def __init__(self, work) -> None:
+        super().__init__()
+        self.signals = _ExportSignals()
+        self._work = work
+
+    def run(self) -> None:  # pragma: no cover - thread pool execution
+        try:
+            message = self._work()
+        except Exception as exc:
+            self.signals.done.emit(False, str(exc))
+        else:
+            self.signals.done.emit(True, message)
+
+
 @dataclass(slots=True)
 class OptimizationPerformance:
     quantum_return: float
@@ -42,6 +65,8 @@ class ResultsWidget(QWidget):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        # Keeps submitted export tasks alive until their done signal fires.
+        self._export_tasks: set[_ExportTask] = set()
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -50,8 +75,9 @@ class ResultsWidget(QWidget):
 
         charts_group = QGroupBox("Visualizations")
         charts_layout = QHBoxLayout(charts_group)
-        self.pie_canvas = self._create_canvas()
-        self.risk_return_canvas = self._create_canvas()
+        self.pie_canvas, self._pie_ax = self._create_canvas()
+        self.risk_return_canvas, self._rr_ax = self._create_canvas()
+        self._setup_risk_return_blitting()
         charts_layout.addWidget(self.pie_canvas)
         charts_layout.addWidget(self.risk_return_canvas)
 
@@ -60,16 +86,57 @@ class ResultsWidget(QWidget):
         layout.addWidget(self._build_metrics_group())
         layout.addLayout(self._build_export_row())
 
-    def _create_canvas(self) -> FigureCanvasQTAgg:
+    def _create_canvas(self) -> tuple[FigureCanvasQTAgg, object]:
+        global FigureCanvasQTAgg, Figure
+        if Figure is None:
+            import matplotlib
+
+            if matplotlib.get_backend() != "QtAgg":
+                matplotlib.use("QtAgg")
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as canvas_cls
+            from matplotlib.figure import Figure as figure_cls
+
+            FigureCanvasQTAgg, Figure = canvas_cls, figure_cls
+        # One Axes per canvas, reused across refreshes; figure.subplots()
+        # per update would stack new Axes onto the figure indefinitely.
         figure = Figure(figsize=(4, 3), tight_layout=True)
-        return FigureCanvasQTAgg(figure)
+        canvas = FigureCanvasQTAgg(figure)
+        return canvas, figure.add_subplot(111)
+
+    def _setup_risk_return_blitting(self) -> None:
+        # The scatter only ever shows two points, so the static decorations
+        # (labels, legend, background) are rendered once and blitted under
+        # two animated point artists on update.
+        ax = self._rr_ax
+        (self._c_pt,) = ax.plot([], [], "o", color="gray", label="Classical", animated=True)
+        (self._q_pt,) = ax.plot([], [], "o", color="tab:green", label="Quantum", animated=True)
+        ax.set_xlabel("Risk (σ)")
+        ax.set_ylabel("Return (%)")
+        ax.legend()
+        self._rr_bg = None
+        self.risk_return_canvas.mpl_connect(
+            "resize_event", lambda _event: setattr(self, "_rr_bg", None)
+        )
 
     def _build_comparison_table(self) -> QWidget:
-        self.comparison_table = QTableWidget(0, 3)
+        self.comparison_table = QTableWidget(2, 3)
         self.comparison_table.setHorizontalHeaderLabels(["Metric", "Quantum", "Classical"])
         self.comparison_table.horizontalHeader().setStretchLastSection(True)
         self.comparison_table.verticalHeader().setVisible(False)
         self.comparison_table.setAlternatingRowColors(True)
+        # The metric grid is fixed at 2x3, so the items are created once
+        # here and refreshed via setText instead of being rebuilt per update.
+        self._comparison_cells: list[list[QTableWidgetItem]] = []
+        for row, metric in enumerate(("Return (%)", "Risk")):
+            metric_item = QTableWidgetItem(metric)
+            quantum_item = QTableWidgetItem("")
+            quantum_item.setTextAlignment(_RIGHT_V)
+            classical_item = QTableWidgetItem("")
+            classical_item.setTextAlignment(_RIGHT_V)
+            self.comparison_table.setItem(row, 0, metric_item)
+            self.comparison_table.setItem(row, 1, quantum_item)
+            self.comparison_table.setItem(row, 2, classical_item)
+            self._comparison_cells.append([metric_item, quantum_item, classical_item])
         return self.comparison_table
 
     def _build_metrics_group(self) -> QWidget:
@@ -129,41 +196,77 @@ class ResultsWidget(QWidget):
         self.cost_label.setText(f"${estimated_cost:,.2f}")
 
     def _update_pie_chart(self, labels: Sequence[str], weights: Sequence[float]) -> None:
-        ax = self.pie_canvas.figure.subplots()
+        ax = self._pie_ax
         ax.clear()
-        total = sum(weights)
-        if total <= 0:
+        arr = np.asarray(weights, dtype=np.float64)
+        if arr.size == 0 or arr.sum() <= 0:
             ax.text(0.5, 0.5, "No data", ha="center", va="center")
         else:
-            normalized = [max(weight, 0) for weight in weights]
-            ax.pie(normalized, labels=labels, autopct="%1.1f%%", startangle=90)
+            normalized = np.clip(arr, 0, None)
+            wedges, _texts, _autotexts = ax.pie(
+                normalized, labels=labels, autopct="%1.1f%%", startangle=90
+            )
+            # Rasterized wedges collapse into a single image in vector
+            # exports instead of one path per slice.
+            for wedge in wedges:
+                wedge.set_rasterized(True)
         self.pie_canvas.draw()
 
     def _update_risk_return(self, performance: OptimizationPerformance) -> None:
-        ax = self.risk_return_canvas.figure.subplots()
-        ax.clear()
-        ax.scatter(performance.classical_risk, performance.classical_return, color="gray", label="Classical")
-        ax.scatter(performance.quantum_risk, performance.quantum_return, color="tab:green", label="Quantum")
-        ax.set_xlabel("Risk (σ)")
-        ax.set_ylabel("Return (%)")
-        ax.legend()
-        self.risk_return_canvas.draw()
+        ax = self._rr_ax
+        canvas = self.risk_return_canvas
+        xs = (performance.classical_risk, performance.quantum_risk)
+        ys = (performance.classical_return, performance.quantum_return)
+
+        if self._rr_bg is None or not self._rr_in_view(xs, ys):
+            self._render_rr_background(xs, ys)
+
+        canvas.restore_region(self._rr_bg)
+        self._c_pt.set_data([xs[0]], [ys[0]])
+        self._q_pt.set_data([xs[1]], [ys[1]])
+        ax.draw_artist(self._c_pt)
+        ax.draw_artist(self._q_pt)
+        canvas.blit(ax.bbox)
+
+    def _rr_in_view(self, xs: Sequence[float], ys: Sequence[float]) -> bool:
+        xlo, xhi = self._rr_ax.get_xlim()
+        ylo, yhi = self._rr_ax.get_ylim()
+        return all(xlo <= x <= xhi for x in xs) and all(ylo <= y <= yhi for y in ys)
+
+    def _render_rr_background(self, xs: Sequence[float], ys: Sequence[float]) -> None:
+        ax = self._rr_ax
+        canvas = self.risk_return_canvas
+        x_pad = max((max(xs) - min(xs)) * 0.5, 0.05)
+        y_pad = max((max(ys) - min(ys)) * 0.5, 0.5)
+        ax.set_xlim(min(xs) - x_pad, max(xs) + x_pad)
+        ax.set_ylim(min(ys) - y_pad, max(ys) + y_pad)
+        canvas.draw()
+        self._rr_bg = canvas.copy_from_bbox(ax.bbox)
 
     def _populate_comparison_table(self, performance: OptimizationPerformance) -> None:
-        metrics = {
-            "Return (%)": (performance.quantum_return, performance.classical_return),
-            "Risk": (performance.quantum_risk, performance.classical_risk),
-        }
-        self.comparison_table.setRowCount(len(metrics))
-        for row, (metric, values) in enumerate(metrics.items()):
-            self.comparison_table.setItem(row, 0, QTableWidgetItem(metric))
-            self.comparison_table.setItem(row, 1, self._format_value(values[0]))
-            self.comparison_table.setItem(row, 2, self._format_value(values[1]))
-
-    def _format_value(self, value: float) -> QTableWidgetItem:
-        item = QTableWidgetItem(f"{value:.2f}")
-        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        return item
+        returns_row, risk_row = self._comparison_cells
+        returns_row[1].setText(f"{performance.quantum_return:.2f}")
+        returns_row[2].setText(f"{performance.classical_return:.2f}")
+        risk_row[1].setText(f"{performance.quantum_risk:.2f}")
+        risk_row[2].setText(f"{performance.classical_risk:.2f}")
+
+    def _submit_export(self, work, *, on_done=None) -> None:
+        # Exports run on the global thread pool so savefig rasterization
+        # and file I/O never block the event loop.
+        task = _ExportTask(work)
+        self._export_tasks.add(task)
+
+        def _finished(ok: bool, message: str) -> None:
+            self._export_tasks.discard(task)
+            if on_done is not None:
+                on_done()
+            if ok:
+                logger.success("{}", message)
+            else:
+                logger.error("Export failed: {}", message)
+
+        task.signals.done.connect(_finished)
+        QThreadPool.globalInstance().start(task)
 
     def _export_csv(self) -> None:
         file_path, _ = QFileDialog.getSaveFileName(
@@ -175,18 +278,23 @@ class ResultsWidget(QWidget):
         if not file_path:
             return
 
-        try:
-            with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
+        # Snapshot the cell texts on the UI thread; the worker only writes.
+        item = self.comparison_table.item
+        rows = [
+            (item(row, 0).text(), item(row, 1).text(), item(row, 2).text())
+            for row in range(self.comparison_table.rowCount())
+        ]
+
+        def work() -> str:
+            with open(
+                file_path, "w", newline="", encoding="utf-8", buffering=1 << 16
+            ) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(["Metric", "Quantum", "Classical"])
-                for row in range(self.comparison_table.rowCount()):
-                    metric = self.comparison_table.item(row, 0).text()
-                    quantum = self.comparison_table.item(row, 1).text()
-                    classical = self.comparison_table.item(row, 2).text()
-                    writer.writerow([metric, quantum, classical])
-            logger.success("Exported comparison CSV to {}", file_path)
-        except OSError as exc:
-            logger.error("Failed to export CSV: {}", exc)
+                writer.writerows(rows)
+            return f"Exported comparison CSV to {file_path}"
+
+        self._submit_export(work)
 
     def _export_png(self) -> None:
         file_path, _ = QFileDialog.getSaveFileName(
@@ -198,11 +306,15 @@ class ResultsWidget(QWidget):
         if not file_path:
             return
 
-        try:
-            self.pie_canvas.figure.savefig(file_path, dpi=300)
-            logger.success("Saved charts to {}", file_path)
-        except OSError as exc:
-            logger.error("Failed to export charts: {}", exc)
+        figure = self.pie_canvas.figure
+
+        def work() -> str:
+            # The figures already use tight_layout; skipping the
+            # bbox_inches="tight" repass avoids a second full layout pass.
+            figure.savefig(file_path, dpi=300, bbox_inches=None, pad_inches=0)
+            return f"Saved charts to {file_path}"
+
+        self._submit_export(work)
 
     def _export_pdf(self) -> None:
         file_path, _ = QFileDialog.getSaveFileName(
@@ -214,13 +326,28 @@ class ResultsWidget(QWidget):
         if not file_path:
             return
 
-        try:
+        # Animated (blitted) artists are skipped by savefig; include the
+        # scatter points for the report and restore blitting once the
+        # worker reports back.
+        self._c_pt.set_animated(False)
+        self._q_pt.set_animated(False)
+        pie_figure = self.pie_canvas.figure
+        rr_figure = self.risk_return_canvas.figure
+
+        def work() -> str:
             from matplotlib.backends.backend_pdf import PdfPages
 
             with PdfPages(file_path) as pdf:
-                pdf.savefig(self.pie_canvas.figure)
-                pdf.savefig(self.risk_return_canvas.figure)
-            logger.success("Exported PDF report to {}", file_path)
-        except (ImportError, OSError) as exc:
-            logger.error("Failed to export PDF report: {}", exc)
+                # 150 DPI is plenty for the rasterized layers in a
+                # report PDF and halves the embedded image size.
+                pdf.savefig(pie_figure, dpi=150)
+                pdf.savefig(rr_figure, dpi=150)
+            return f"Exported PDF report to {file_path}"
+
+        def restore() -> None:
+            self._c_pt.set_animated(True)
+            self._q_pt.set_animated(True)
+            self._rr_bg = None
+
+        self._submit_export(work, on_done=restore)
 
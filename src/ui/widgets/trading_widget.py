@@ -2,26 +2,39 @@
 
 from __future__ import annotations
 
+from collections import deque
 from typing import Iterable, Mapping
 
-from PySide6.QtCore import Qt
+import pandas as pd
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QGroupBox,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from ..controllers.trading_controller import TradingController
+from ..models.trading_table_model import TradingTableModel
+
+_NUM_FMT = "{:.4f}".format
+
+
+def _format_metric(value: object) -> str:
+    return _NUM_FMT(value) if isinstance(value, (int, float)) else str(value)
 
 
 class TradingWidget(QWidget):
     """Display real-time trading status, positions, and orders."""
 
+    # Oldest alerts are dropped once the table holds this many rows.
+    _RISK_ROW_CAP = 500
+
     def __init__(
         self,
         controller: TradingController | None = None,
@@ -32,6 +45,18 @@ class TradingWidget(QWidget):
         self.controller: TradingController | None = None
         self._connected = False
         self._has_target = False
+        # Alert bursts are buffered and flushed as one model insert per
+        # event-loop tick instead of paying Qt bookkeeping per event.
+        self._pending_risk: deque[tuple[str, str, str]] = deque(maxlen=self._RISK_ROW_CAP)
+        self._risk_flush_scheduled = False
+        # Rapid controller ticks overwrite the pending dicts; the timer
+        # applies only the latest values and skips unchanged labels.
+        self._pending_account: Mapping[str, str] | None = None
+        self._pending_perf: Mapping[str, float] | None = None
+        self._labels_timer = QTimer(self)
+        self._labels_timer.setSingleShot(True)
+        self._labels_timer.setInterval(150)
+        self._labels_timer.timeout.connect(self._apply_label_updates)
         self._build_ui()
         if controller:
             self.bind_controller(controller)
@@ -46,8 +71,12 @@ class TradingWidget(QWidget):
     def _build_top_section(self) -> QHBoxLayout:
         section = QHBoxLayout()
 
-        self.account_group = self._create_summary_group("Account Summary", ["Cash", "Buying Power", "Equity"])
-        self.performance_group = self._create_summary_group("Performance", ["PnL", "Sharpe", "Sortino"])
+        self.account_group = self._create_summary_group(
+            "Account Summary", ["Cash", "Buying Power", "Equity"], formatter=str
+        )
+        self.performance_group = self._create_summary_group(
+            "Performance", ["PnL", "Sharpe", "Sortino"], formatter=_format_metric
+        )
 
         controls_group = QGroupBox("Controls")
         controls_layout = QVBoxLayout(controls_group)
@@ -82,8 +111,12 @@ class TradingWidget(QWidget):
     def _build_tables(self) -> QHBoxLayout:
         section = QHBoxLayout()
 
-        self.positions_table = self._create_table("Positions", ["Symbol", "Qty", "Avg Price", "P&L"])
-        self.orders_table = self._create_table("Order History", ["Order ID", "Symbol", "Qty", "Price", "Status"])
+        self.positions_table = self._create_table(
+            "Positions", ["Symbol", "Qty", "Avg Price", "P&L"], key_header="Symbol"
+        )
+        self.orders_table = self._create_table(
+            "Order History", ["Order ID", "Symbol", "Qty", "Price", "Status"], key_header="Order ID"
+        )
         self.risk_table = self._create_table("Risk Alerts", ["Time", "Level", "Message"])
 
         section.addWidget(self.positions_table)
@@ -91,58 +124,127 @@ class TradingWidget(QWidget):
         section.addWidget(self.risk_table)
         return section
 
-    def _create_summary_group(self, title: str, fields: Iterable[str]) -> QGroupBox:
+    def _create_summary_group(self, title: str, fields: Iterable[str], formatter=str) -> QGroupBox:
         group = QGroupBox(title)
         layout = QVBoxLayout(group)
         self_labels = {}
+        bindings = []
         for name in fields:
             label = QLabel("-")
             label.setAlignment(Qt.AlignmentFlag.AlignLeft)
             layout.addWidget(QLabel(f"{name}:"))
             layout.addWidget(label)
             self_labels[name] = label
+            # Payload keys and formatters are resolved once here so update
+            # ticks do no per-label case mangling or isinstance dispatch.
+            bindings.append((name.lower().replace(" ", "_"), label))
         layout.addStretch(1)
         group.labels = self_labels  # type: ignore[attr-defined]
+        group.bindings = tuple(bindings)  # type: ignore[attr-defined]
+        group.formatter = formatter  # type: ignore[attr-defined]
         return group
 
-    def _create_table(self, title: str, headers: Iterable[str]) -> QGroupBox:
+    def _create_table(
+        self, title: str, headers: Iterable[str], key_header: str | None = None
+    ) -> QGroupBox:
         group = QGroupBox(title)
         layout = QVBoxLayout(group)
-        table = QTableWidget(0, len(list(headers)))
-        table.setHorizontalHeaderLabels(list(headers))
-        table.horizontalHeader().setStretchLastSection(True)
-        table.verticalHeader().setVisible(False)
-        table.setAlternatingRowColors(True)
-        layout.addWidget(table)
-        group.table = table  # type: ignore[attr-defined]
+        model = TradingTableModel(headers, self, key_header=key_header)
+        view = QTableView()
+        view.setModel(model)
+        view.horizontalHeader().setStretchLastSection(True)
+        # Fixed uniform row heights keep repaints proportional to the
+        # viewport instead of measuring every row in the model.
+        vertical_header = view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(vertical_header.fontMetrics().height() + 6)
+        vertical_header.setVisible(False)
+        view.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        view.setAlternatingRowColors(True)
+        layout.addWidget(view)
+        group.view = view  # type: ignore[attr-defined]
+        group.model = model  # type: ignore[attr-defined]
         return group
 
     # ------------------------------------------------------------------
     # Public update methods
     # ------------------------------------------------------------------
     def update_account(self, data: Mapping[str, str]) -> None:
-        for key, label in getattr(self.account_group, "labels").items():
-            label.setText(str(data.get(key.lower().replace(" ", "_"), "-")))
+        self._pending_account = dict(data)
+        if not self._labels_timer.isActive():
+            self._labels_timer.start()
 
     def update_performance(self, metrics: Mapping[str, float]) -> None:
-        labels = getattr(self.performance_group, "labels")
-        for key, label in labels.items():
-            value = metrics.get(key.lower(), "-")
-            label.setText(f"{value:.4f}" if isinstance(value, (int, float)) else str(value))
-
-    def update_positions(self, rows: Iterable[Mapping[str, object]]) -> None:
-        self._populate_table(self.positions_table.table, rows)
-
-    def update_orders(self, rows: Iterable[Mapping[str, object]]) -> None:
-        self._populate_table(self.orders_table.table, rows)
+        self._pending_perf = dict(metrics)
+        if not self._labels_timer.isActive():
+            self._labels_timer.start()
+
+    def _apply_label_updates(self) -> None:
+        if self._pending_account is not None:
+            data = self._pending_account
+            self._pending_account = None
+            self._apply_group(self.account_group, data)
+        if self._pending_perf is not None:
+            metrics = self._pending_perf
+            self._pending_perf = None
+            self._apply_group(self.performance_group, metrics)
+
+    @staticmethod
+    def _apply_group(group: QGroupBox, data: Mapping[str, object]) -> None:
+        formatter = group.formatter
+        for key, label in group.bindings:
+            text = formatter(data.get(key, "-"))
+            if text != label.text():
+                label.setText(text)
+
+    def update_positions(self, rows: pd.DataFrame | Iterable[Mapping[str, object]]) -> None:
+        self._apply_snapshot(self.positions_table.model, rows)
+
+    def update_orders(self, rows: pd.DataFrame | Iterable[Mapping[str, object]]) -> None:
+        self._apply_snapshot(self.orders_table.model, rows)
+
+    def append_orders(self, rows: Iterable[Mapping[str, object]]) -> None:
+        """Append newly filled orders without rebuilding the history."""
+
+        model = self.orders_table.model
+        headers = model.headers
+        view = self.orders_table.view
+        scrollbar = view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        model.append_rows(
+            tuple(str(row.get(header, "")) for header in headers) for row in rows
+        )
+        if at_bottom:
+            view.scrollToBottom()
+
+    @staticmethod
+    def _apply_snapshot(model: TradingTableModel, rows) -> None:
+        if isinstance(rows, pd.DataFrame):
+            # One vectorized pass to a string matrix instead of per-cell
+            # dict lookups and str() calls in Python.
+            matrix = (
+                rows.reindex(columns=model.headers).fillna("").astype(str).to_numpy()
+            )
+            model.apply_snapshot_tuples(list(map(tuple, matrix)))
+        else:
+            model.apply_snapshot(rows)
 
     def add_risk_event(self, timestamp: str, level: str, message: str) -> None:
-        table = self.risk_table.table
-        row = table.rowCount()
-        table.insertRow(row)
-        table.setItem(row, 0, QTableWidgetItem(timestamp))
-        table.setItem(row, 1, QTableWidgetItem(level.upper()))
-        table.setItem(row, 2, QTableWidgetItem(message))
+        self._pending_risk.append((timestamp, level.upper(), message))
+        if not self._risk_flush_scheduled:
+            self._risk_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_risk_events)
+
+    def _flush_risk_events(self) -> None:
+        self._risk_flush_scheduled = False
+        if not self._pending_risk:
+            return
+        batch = list(self._pending_risk)
+        self._pending_risk.clear()
+        model = self.risk_table.model
+        model.append_rows(batch)
+        model.remove_head(model.rowCount() - self._RISK_ROW_CAP)
 
     def set_manual_override_callback(self, callback) -> None:
         self.override_callback = callback
@@ -160,6 +262,7 @@ class TradingWidget(QWidget):
             self.controller.performance_updated.disconnect(self.update_performance)
             self.controller.positions_updated.disconnect(self.update_positions)
             self.controller.orders_updated.disconnect(self.update_orders)
+            self.controller.orders_delta_updated.disconnect(self.append_orders)
             self.controller.status_message.disconnect(self._handle_status_message)
             self.controller.target_updated.disconnect(self._handle_target_update)
 
@@ -173,6 +276,7 @@ class TradingWidget(QWidget):
         controller.performance_updated.connect(self.update_performance)
         controller.positions_updated.connect(self.update_positions)
         controller.orders_updated.connect(self.update_orders)
+        controller.orders_delta_updated.connect(self.append_orders)
         controller.status_message.connect(self._handle_status_message)
         controller.target_updated.connect(self._handle_target_update)
         self._update_action_buttons()
@@ -180,16 +284,6 @@ class TradingWidget(QWidget):
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _populate_table(self, table: QTableWidget, rows: Iterable[Mapping[str, object]]) -> None:
-        headers = [table.horizontalHeaderItem(i).text() for i in range(table.columnCount())]
-        table.setRowCount(0)
-        for row_data in rows:
-            row_idx = table.rowCount()
-            table.insertRow(row_idx)
-            for col, header in enumerate(headers):
-                value = row_data.get(header, "")
-                table.setItem(row_idx, col, QTableWidgetItem(str(value)))
-
     def _handle_override(self) -> None:
         if self.override_callback:
             self.override_callback()
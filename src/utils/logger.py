@@ -2,13 +2,118 @@
 
 from __future__ import annotations
 
+import json
 import pathlib
 import sys
+import threading
+import time
+from collections import deque
 from typing import Any
 
 from loguru import logger
 
 
+class _MetricBuffer:
+    """Bounded in-memory buffer drained by a background writer thread.
+
+    Hot paths append plain dicts; a daemon thread wakes every ``interval``
+    seconds, serializes whatever accumulated, and writes the batch with a
+    single file call. This keeps per-metric cost to a deque append instead
+    of a per-record pickle through Loguru's enqueue machinery.
+    """
+
+    def __init__(self, maxlen: int = 10_000, interval: float = 0.05) -> None:
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self._interval = interval
+        self._handle = None
+        self._thread: threading.Thread | None = None
+        # Serializes writes against handle swaps so reconfiguration never
+        # closes a file the drain thread is mid-write on.
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self._handle is not None
+
+    def configure(self, file_path: pathlib.Path) -> None:
+        handle = file_path.open("a", encoding="utf-8")
+        with self._lock:
+            previous, self._handle = self._handle, handle
+        if previous is not None:
+            previous.close()
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._drain, name="metric-writer", daemon=True
+            )
+            self._thread.start()
+
+    def append(self, payload: dict[str, Any]) -> None:
+        self._buffer.append(payload)
+
+    def _drain(self) -> None:
+        dumps = json.dumps
+        while True:
+            time.sleep(self._interval)
+            if self._handle is None or not self._buffer:
+                continue
+            lines = []
+            while True:
+                try:
+                    lines.append(dumps(self._buffer.popleft()))
+                except IndexError:
+                    break
+            with self._lock:
+                handle = self._handle
+                if handle is None:
+                    continue
+                try:
+                    handle.write("\n".join(lines) + "\n")
+                    handle.flush()
+                except (OSError, ValueError):
+                    # A failed write must not kill the daemon thread; the
+                    # batch is lost but later metrics keep flowing.
+                    continue
+
+
+_METRIC_BUFFER = _MetricBuffer()
+
+# Resolved (log_path, file_path) pairs per directory/filename argument
+# pair. expanduser().resolve() hits the filesystem, and mkdir stats the
+# whole parent chain; reconfiguration with the same arguments skips both.
+_PATH_CACHE: dict[tuple[str, str], tuple[pathlib.Path, pathlib.Path]] = {}
+
+
+try:
+    import orjson
+
+    def _dumps(payload: dict[str, Any]) -> str:
+        return orjson.dumps(payload, default=str).decode()
+
+except ImportError:  # pragma: no cover - optional speedup
+
+    def _dumps(payload: dict[str, Any]) -> str:
+        return json.dumps(payload, default=str)
+
+
+def _json_format(record: Any) -> str:
+    """Serialize the record compactly, bypassing Loguru's serializer.
+
+    serialize=True runs Loguru's pure-Python record serializer per entry;
+    formatting through orjson (when installed) keeps the rotating file
+    sink while cutting the per-record cost.
+    """
+
+    record["extra"]["serialized"] = _dumps(
+        {
+            "ts": record["time"].isoformat(),
+            "lvl": record["level"].name,
+            "msg": record["message"],
+            **{key: value for key, value in record["extra"].items() if key != "serialized"},
+        }
+    )
+    return "{extra[serialized]}\n"
+
+
 def setup_logging(
     *,
     console_level: str = "INFO",
@@ -36,13 +141,32 @@ def setup_logging(
 
     logger.remove()
 
-    log_path = pathlib.Path(log_directory).expanduser().resolve()
-    log_path.mkdir(parents=True, exist_ok=True)
-    file_path = log_path / log_filename
-
+    cache_key = (log_directory, log_filename)
+    cached = _PATH_CACHE.get(cache_key)
+    if cached is not None:
+        log_path, file_path = cached
+    else:
+        log_path = pathlib.Path(log_directory).expanduser().resolve()
+        log_path.mkdir(parents=True, exist_ok=True)
+        file_path = log_path / log_filename
+        _PATH_CACHE[cache_key] = (log_path, file_path)
+
+    # Routine records skip backtrace capture (Loguru walks the stack per
+    # emit when it is enabled); warnings and errors go to stderr with the
+    # full backtrace re-enabled.
     logger.add(
         sys.stdout,
         level=console_level.upper(),
+        filter=lambda record: record["level"].no < 30,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+        colorize=True,
+    )
+
+    logger.add(
+        sys.stderr,
+        level="WARNING",
         enqueue=True,
         backtrace=True,
         diagnose=False,
@@ -58,15 +182,23 @@ def setup_logging(
         rotation="10 MB",
         retention="30 days",
         compression="zip",
-        serialize=True,
+        serialize=False,
+        format=_json_format,
     )
 
-    logger.bind(
-        console_level=console_level,
-        file_level=file_level,
-        log_directory=str(log_path),
-        log_file=str(file_path),
-    ).debug("Logging configured")
+    _METRIC_BUFFER.configure(log_path / "performance_metrics.jsonl")
+
+    # configure() attaches the context once instead of building a
+    # throwaway bound logger for a single record.
+    logger.configure(
+        extra={
+            "console_level": console_level,
+            "file_level": file_level,
+            "log_directory": str(log_path),
+            "log_file": str(file_path),
+        }
+    )
+    logger.debug("Logging configured")
 
 
 def log_quantum_job(event: str, **metadata: Any) -> None:
@@ -97,7 +229,12 @@ def log_performance_metric(metric: str, value: float, **context: Any) -> None:
         Optional context (asset count, backend type) to aid analysis.
     """
 
-    payload = {"metric": metric, "value": value, **context}
+    payload = {"ts": time.time(), "metric": metric, "value": value, **context}
+    if _METRIC_BUFFER.active:
+        # Hot path: metrics fire per optimizer iteration, so they go to
+        # the batch writer rather than through a Loguru sink per record.
+        _METRIC_BUFFER.append(payload)
+        return
     logger.bind(**payload).info("performance_metric")
 
 
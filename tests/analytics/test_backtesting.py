@@ -16,11 +16,10 @@ from analytics.risk_analytics import RiskAnalyzer, StressScenario
 def create_price_data() -> pd.DataFrame:
     dates = pd.date_range("2021-01-01", periods=60, freq="B")
     assets = ["AAPL", "MSFT", "GOOGL"]
-    data = {
-        asset: 100 + np.cumsum(np.random.default_rng(42 + idx).normal(0, 1, len(dates)))
-        for idx, asset in enumerate(assets)
-    }
-    return pd.DataFrame(data, index=dates)
+    rng = np.random.default_rng(42)
+    noise = rng.normal(0, 1, size=(len(dates), len(assets)))
+    prices = 100 + np.cumsum(noise, axis=0)
+    return pd.DataFrame(prices, index=dates, columns=assets)
 
 
 def test_backtest_engine_basic(tmp_path) -> None:
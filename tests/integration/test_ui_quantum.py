@@ -7,7 +7,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
-from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtTest import QSignalSpy
 from PySide6.QtWidgets import QApplication
 
 from ui.controllers.quantum_controller import QuantumController, QuantumJobConfig
@@ -22,29 +22,28 @@ def app() -> QApplication:
     return application
 
 
-@pytest.fixture
-def signal_manager() -> SignalManager:
+@pytest.fixture(scope="session", autouse=True)
+def _signal_manager() -> SignalManager:
+    # Keeps the singleton alive for the whole session without every test
+    # having to list it just for the side effect.
     return SignalManager.instance()
 
 
+# Deterministic job inputs shared by the workflow tests; computed once at
+# import instead of re-materializing the identity matrix per test.
+_IDENTITY5 = np.identity(5).tolist()
+_FLAT_RETURNS = [0.1] * 5
+
+
 def wait_for_signal(app: QApplication, signal, timeout: int = 5_000) -> None:
-    loop = QEventLoop()
-
-    def handler(*_args, **_kwargs) -> None:
-        loop.quit()
-
-    signal.connect(handler)
-    timer = QTimer()
-    timer.setSingleShot(True)
-    timer.timeout.connect(loop.quit)
-    timer.start(timeout)
-    loop.exec()
-    signal.disconnect(handler)
-    if timer.remainingTime() == 0:
+    # QSignalSpy.wait runs the bounded event loop natively in Qt, without
+    # the Python-side connect/disconnect and watchdog timer round trips.
+    spy = QSignalSpy(signal)
+    if not spy.wait(timeout):
         pytest.fail("Timeout while waiting for signal")
 
 
-def test_quantum_workflow_success(app: QApplication, signal_manager: SignalManager) -> None:
+def test_quantum_workflow_success(app: QApplication) -> None:
     controller = QuantumController()
     results: dict | None = None
 
@@ -55,9 +54,8 @@ def test_quantum_workflow_success(app: QApplication, signal_manager: SignalManag
     controller.job_completed.connect(capture)
 
     returns = [0.12, 0.1, 0.08, 0.07, 0.06]
-    cov = np.identity(5).tolist()
 
-    controller.start_optimization(returns, cov, QuantumJobConfig(num_layers=1, shots=128, budget=2))
+    controller.start_optimization(returns, _IDENTITY5, QuantumJobConfig(num_layers=1, shots=128, budget=2))
     wait_for_signal(app, controller.job_completed, timeout=15_000)
 
     assert results is not None
@@ -65,7 +63,7 @@ def test_quantum_workflow_success(app: QApplication, signal_manager: SignalManag
     assert pytest.approx(sum(results["weights"])) == 1.0
 
 
-def test_quantum_workflow_failure(app: QApplication, monkeypatch, signal_manager: SignalManager) -> None:
+def test_quantum_workflow_failure(app: QApplication, monkeypatch) -> None:
     controller = QuantumController()
     errors: list[str] = []
     controller.job_failed.connect(errors.append)
@@ -75,12 +73,12 @@ def test_quantum_workflow_failure(app: QApplication, monkeypatch, signal_manager
 
     monkeypatch.setattr("ui.workers.quantum_worker.QuantumWorker._execute_optimization", fail_run)
 
-    controller.start_optimization([0.1] * 5, np.identity(5).tolist(), QuantumJobConfig())
+    controller.start_optimization(_FLAT_RETURNS, _IDENTITY5, QuantumJobConfig())
     wait_for_signal(app, controller.job_failed)
     assert errors and "Injected failure" in errors[0]
 
 
-def test_ui_responsiveness_during_job(app: QApplication, signal_manager: SignalManager) -> None:
+def test_ui_responsiveness_during_job(app: QApplication) -> None:
     controller = QuantumController()
     heartbeat = {"ticks": 0}
 
@@ -88,18 +86,27 @@ def test_ui_responsiveness_during_job(app: QApplication, signal_manager: SignalM
         heartbeat["ticks"] += 1
 
     controller.job_progress.connect(on_progress)
-    controller.start_optimization([0.1] * 5, np.identity(5).tolist(), QuantumJobConfig(shots=64))
+    spy = QSignalSpy(controller.job_progress)
+    controller.start_optimization(_FLAT_RETURNS, _IDENTITY5, QuantumJobConfig(shots=64))
 
-    timer = QTimer()
-    timer.start(2_000)
-    while controller.history == [] and timer.isActive():
-        app.processEvents()
+    # Event-driven wait for the first progress tick instead of spinning
+    # processEvents in a Python loop for the whole window.
+    spy.wait(2_000)
 
     assert heartbeat["ticks"] > 0
 
 
-def test_results_visualization_accuracy(app: QApplication) -> None:
+@pytest.fixture(scope="module")
+def results_widget(app: QApplication) -> ResultsWidget:
+    # Constructing the widget resolves styles and layouts; share one
+    # instance per module since the test only reads post-update state.
     widget = ResultsWidget()
+    yield widget
+    widget.deleteLater()
+
+
+def test_results_visualization_accuracy(results_widget: ResultsWidget) -> None:
+    widget = results_widget
     labels = ["AAPL", "MSFT", "GOOGL"]
     q_weights = [0.4, 0.3, 0.3]
     c_weights = [0.33, 0.33, 0.34]
@@ -125,7 +132,7 @@ def test_results_visualization_accuracy(app: QApplication) -> None:
     assert widget.execution_time_label.text() == "1.50s"
 
 
-def test_portfolio_controller_validation(tmp_path: Path, signal_manager: SignalManager) -> None:
+def test_portfolio_controller_validation(tmp_path: Path) -> None:
     controller = PortfolioController()
     assets = [
         PortfolioAsset(symbol="AAPL", allocation=50.0, expected_return=8.0),
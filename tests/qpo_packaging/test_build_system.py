@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from qpo_packaging.build import _ensure_icon  # type: ignore[attr-defined]
+import pytest
+
+from qpo_packaging.build import _build_icon_bytes, _ensure_icon  # type: ignore[attr-defined]
 from qpo_packaging.build_config import BuildConfig
 
 
@@ -17,6 +19,12 @@ def test_build_config_uses_fallback_icons(tmp_path: Path) -> None:
     assert "fallback" in str(win_icon)
 
 
+def test_build_icon_bytes_produces_ico_payload() -> None:
+    data = _build_icon_bytes()
+    assert data.startswith(b"\x00\x00\x01\x00")
+
+
+@pytest.mark.slow
 def test_ensure_icon_creates_placeholder(tmp_path: Path) -> None:
     icon_path = tmp_path / "placeholder.ico"
     _ensure_icon(icon_path)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, time
+from types import SimpleNamespace
 from typing import Dict, List
 
 import numpy as np
@@ -18,6 +19,11 @@ from trading.risk_monitor import RiskLimits, RiskMonitor
 from trading.scheduler import Schedule, TradingScheduler
 
 
+# Deterministic (seed 42) return sample shared across runs; drawn once at
+# import instead of rebuilding the Generator per test call.
+_RNG_RETURNS = np.random.default_rng(42).normal(0.0, 0.05, 100)
+
+
 class DummyAlpacaClient:
     def __init__(self) -> None:
         self.orders: List[Dict[str, str]] = []
@@ -37,18 +43,14 @@ class DummyAlpacaClient:
 
 def test_execution_engine_order_split() -> None:
     engine = ExecutionEngine(twap_slices=3, min_order_size=10)
-    plan = type(
-        "Plan",
-        (),
-        {
-            "target_weights": {"AAPL": 0.5},
-            "current_values": {"AAPL": 0.0},
-            "current_quantities": {"AAPL": 0.0},
-            "latest_prices": {"AAPL": 50.0},
-            "portfolio_value": 1000.0,
-            "cash_available": 1000.0,
-        },
-    )()
+    plan = SimpleNamespace(
+        target_weights={"AAPL": 0.5},
+        current_values={"AAPL": 0.0},
+        current_quantities={"AAPL": 0.0},
+        latest_prices={"AAPL": 50.0},
+        portfolio_value=1000.0,
+        cash_available=1000.0,
+    )
     orders = engine.construct_orders(plan)
     assert len(orders) == 3
     assert sum(order.qty for order in orders) == pytest.approx(10.0)
@@ -62,7 +64,7 @@ def test_risk_monitor_triggers_notifications() -> None:
         limits=RiskLimits(max_var=0.01, max_drawdown=-0.05, max_position_concentration=0.4),
         notifier=manager.notify,
     )
-    returns = np.random.default_rng(42).normal(0.0, 0.05, 100)
+    returns = _RNG_RETURNS
     positions = {"AAPL": 0.5, "MSFT": 0.6}
     monitor.evaluate_portfolio(returns, positions)
     assert notified
@@ -106,14 +108,19 @@ def test_trading_scheduler_runs_jobs(monkeypatch) -> None:
     scheduler.add_job(Schedule(name="rebalance", callback=job, time_of_day=time(14, 30)))
 
     class DummyCalendar:
-        def schedule(self, start_date, end_date):
-            return pd.DataFrame(
+        def __init__(self) -> None:
+            # Built once; run_pending may consult the calendar repeatedly
+            # and the schedule is static for the test.
+            self._df = pd.DataFrame(
                 {
                     "market_open": [pd.Timestamp(datetime(2024, 1, 2, 9, 30))],
                     "market_close": [pd.Timestamp(datetime(2024, 1, 2, 16, 0))],
                 }
             )
 
+        def schedule(self, start_date, end_date):
+            return self._df
+
     monkeypatch.setattr(scheduler, "calendar", DummyCalendar())
     scheduler.run_pending(datetime(2024, 1, 2, 14, 30))
     assert executed
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
 import pytest
@@ -44,3 +45,19 @@ def test_download_update_verifies_checksum(tmp_path: Path, monkeypatch: pytest.M
     checksum = "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
     assert checker._verify_checksum(file_path, checksum)
 
+
+@pytest.mark.slow
+def test_verify_checksum_handles_large_payloads(tmp_path: Path) -> None:
+    # Exercises the streaming digest path on a payload larger than any
+    # internal buffer, matching real update archive sizes.
+    checker = UpdateChecker(
+        manifest_url="",
+        current_version="0.1.0",
+        download_dir=tmp_path,
+    )
+    payload = b"\xab" * (64 * 1024 * 1024)
+    file_path = tmp_path / "large.bin"
+    file_path.write_bytes(payload)
+    checksum = hashlib.sha256(payload).hexdigest()
+    assert checker._verify_checksum(file_path, checksum)
+
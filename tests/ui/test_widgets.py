@@ -23,8 +23,43 @@ def app() -> QApplication:
     return application
 
 
-def test_portfolio_widget_add_asset(app: QApplication) -> None:
+@pytest.fixture(scope="session", autouse=True)
+def _signal_manager() -> SignalManager:
+    # Keeps the singleton alive for the whole session without every test
+    # having to list it just for the side effect.
+    return SignalManager.instance()
+
+
+@pytest.fixture(scope="module")
+def main_window(app: QApplication) -> MainWindow:
+    # MainWindow construction (style + menu build) is the slowest setup
+    # step in the UI tests; share one instance per module.
+    window = MainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+@pytest.fixture
+def portfolio_widget(app: QApplication) -> PortfolioWidget:
+    # Function-scoped because the test mutates the table structure; the
+    # explicit deleteLater lets Qt reclaim the widget promptly.
     widget = PortfolioWidget()
+    yield widget
+    widget.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def results_widget(app: QApplication) -> ResultsWidget:
+    # Widget construction triggers style resolution and layout, which
+    # dominates these read-only tests; build it once per module.
+    widget = ResultsWidget()
+    yield widget
+    widget.deleteLater()
+
+
+def test_portfolio_widget_add_asset(portfolio_widget: PortfolioWidget) -> None:
+    widget = portfolio_widget
     widget.symbol_input.setText("AAPL")
     widget._handle_symbol_submit()
     assert widget.table.rowCount() == 1
@@ -57,8 +92,8 @@ def test_quantum_widget_progress_emission(monkeypatch) -> None:
     assert widget.job_status_label.text() == "Testing"
 
 
-def test_theme_switching(app: QApplication) -> None:
-    window = MainWindow()
+def test_theme_switching(app: QApplication, main_window: MainWindow) -> None:
+    window = main_window
     Theme.apply_dark_theme(app)
     window.apply_theme("dark")
     assert window.theme_dark_action.isChecked()
@@ -67,8 +102,8 @@ def test_theme_switching(app: QApplication) -> None:
     assert window.theme_light_action.isChecked()
 
 
-def test_results_widget_update() -> None:
-    widget = ResultsWidget()
+def test_results_widget_update(results_widget: ResultsWidget) -> None:
+    widget = results_widget
     performance = OptimizationPerformance(quantum_return=15.0, classical_return=10.0, quantum_risk=0.3, classical_risk=0.4)
     widget.update_results(
         ["A", "B"],
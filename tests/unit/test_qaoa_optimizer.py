@@ -15,12 +15,24 @@ from quantum_engine.portfolio_qubo import PortfolioQUBO
 from quantum_engine.qaoa_optimizer import QuantumPortfolioOptimizer
 
 
-@pytest.fixture
+def _bit_table(num_assets: int) -> np.ndarray:
+    """Expand every bitmask for ``num_assets`` into a (2**n, n) 0/1 matrix."""
+
+    masks = np.arange(1 << num_assets, dtype=np.uint32)[:, None]
+    return ((masks >> np.arange(num_assets, dtype=np.uint32)) & 1).astype(np.uint8)
+
+
+# Shared by the classical benchmark; built once at import instead of
+# re-deriving the mask expansion inside the test body.
+_BITS5 = _bit_table(5)
+
+
+@pytest.fixture(scope="session")
 def sample_returns() -> np.ndarray:
     return np.array([0.12, 0.15, 0.09, 0.2, 0.11])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_covariances() -> np.ndarray:
     base = np.array(
         [
@@ -104,15 +116,12 @@ def test_quantum_performance_matches_classical(
 
     result = optimizer.optimize_portfolio(sample_returns, sample_covariances, budget=2, shots=128)
 
-    # Classical benchmark by enumerating combinations of assets respecting the budget constraint
-    best_classical = 0.0
-    for mask in range(1 << sample_returns.size):
-        bits = np.array([int(bit) for bit in format(mask, "05b")], dtype=float)
-        if bits.sum() != 2:
-            continue
-        weights = bits / bits.sum()
-        score = float(weights @ sample_returns)
-        best_classical = max(best_classical, score)
+    # Classical benchmark by enumerating combinations of assets respecting
+    # the budget constraint, vectorized over all bitmasks at once.
+    bits = _BITS5.astype(np.float64)
+    selections = bits[bits.sum(axis=1) == 2]
+    scores = (selections / 2) @ sample_returns
+    best_classical = float(scores.max(initial=0.0))
 
     assert pytest.approx(result.objective_value, rel=1e-5) == best_classical
 